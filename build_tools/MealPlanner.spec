@@ -11,6 +11,8 @@ a = Analysis(
     pathex=['../src'],
     binaries=[],
     datas=[
+        ('../src/default_recipes.sql', '.'),  # Seed recipes loaded on first launch
+        ('../src/help.txt', '.'),  # Help & Info tab text
         # Include any data files if needed
         # ('data', 'data'),  # Uncomment if you want to bundle default database
     ],
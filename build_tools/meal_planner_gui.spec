@@ -17,6 +17,8 @@ a = Analysis(
     datas=[
         ('sample_recipes.json', '.'),
         ('README.md', '.'),
+        ('default_recipes.sql', '.'),
+        ('help.txt', '.'),
     ],
     hiddenimports=[
         'tkinter',
@@ -57,6 +57,12 @@ setup(
     package_data={
         '': ['sample_recipes.json', 'README.md'],
     },
+    # The modules are top-level (py_modules), so package_data can't carry
+    # their data files; these land in <prefix>/share/meal-planner, where
+    # database.find_data_file looks when they aren't next to the modules
+    data_files=[
+        ('share/meal-planner', ['default_recipes.sql', 'help.txt']),
+    ],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
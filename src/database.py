@@ -2,9 +2,13 @@
 
 import sqlite3
 from pathlib import Path
-from typing import Optional, List, Any, Tuple
+from typing import Optional, List, Any
+import atexit
+import functools
+import itertools
 import os
 import sys
+import threading
 
 # Determine data directory based on whether app is frozen (packaged)
 if getattr(sys, 'frozen', False):
@@ -20,320 +24,303 @@ else:
     DATA_DIR = Path(__file__).parent / "data"
 
 DATABASE_PATH = DATA_DIR / "meal_planner.db"
+DATABASE_PATH_STR = str(DATABASE_PATH)  # sqlite3.connect would fspath() the Path each time
+
+# Ensure data directory exists (once per process, not per connection)
+try:
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+except OSError:
+    pass
+
+# Where setup.py's data_files puts the bundled data files on a pip install;
+# source checkouts and frozen builds keep them next to this module instead
+SHARED_DATA_DIR = Path(sys.prefix) / "share" / "meal-planner"
+
+
+def find_data_file(name: str) -> Path:
+    """
+    Locate a data file bundled with the app.
+
+    Args:
+        name: File name, e.g. 'help.txt'
+
+    Returns:
+        Path next to this module if the file is there, otherwise its path
+        under SHARED_DATA_DIR (which may not exist either)
+    """
+    local = Path(__file__).with_name(name)
+    return local if local.is_file() else SHARED_DATA_DIR / name
+
+
+# Seed script for first launch
+DEFAULT_RECIPES_PATH = find_data_file("default_recipes.sql")
+
+# Full schema, run as one script so cold start parses it in a single pass
+SCHEMA_SQL = """
+BEGIN;
+
+-- Create recipes table
+CREATE TABLE IF NOT EXISTS recipes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    meal_type TEXT NOT NULL CHECK(meal_type IN ('breakfast', 'lunch', 'dinner', 'snack')),
+    prep_time INTEGER DEFAULT 0,
+    cook_time INTEGER DEFAULT 0,
+    servings INTEGER NOT NULL DEFAULT 4,
+    cuisine TEXT DEFAULT '',
+    instructions TEXT DEFAULT '',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create ingredients table
+CREATE TABLE IF NOT EXISTS ingredients (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    category TEXT DEFAULT 'Other'
+);
+
+-- Create recipe_ingredients junction table
+CREATE TABLE IF NOT EXISTS recipe_ingredients (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recipe_id INTEGER NOT NULL,
+    ingredient_id INTEGER NOT NULL,
+    quantity REAL NOT NULL,
+    unit TEXT NOT NULL,
+    preparation TEXT DEFAULT '',
+    FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE,
+    FOREIGN KEY (ingredient_id) REFERENCES ingredients(id)
+);
+
+-- Create pantry table
+CREATE TABLE IF NOT EXISTS pantry (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ingredient_id INTEGER NOT NULL,
+    quantity REAL NOT NULL,
+    unit TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (ingredient_id) REFERENCES ingredients(id),
+    UNIQUE(ingredient_id, unit)
+);
+
+-- Create current_meal_plan table
+CREATE TABLE IF NOT EXISTS current_meal_plan (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    day_number INTEGER NOT NULL CHECK(day_number BETWEEN 1 AND 7),
+    meal_type TEXT NOT NULL CHECK(meal_type IN ('breakfast', 'lunch', 'dinner', 'snack')),
+    recipe_id INTEGER NOT NULL,
+    servings INTEGER NOT NULL DEFAULT 2,
+    FOREIGN KEY (recipe_id) REFERENCES recipes(id),
+    UNIQUE(day_number, meal_type)
+);
+
+-- Create dietary_tags table (clustered on its natural key)
+CREATE TABLE IF NOT EXISTS dietary_tags (
+    recipe_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (recipe_id, tag),
+    FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+-- Create indexes for performance
+CREATE INDEX IF NOT EXISTS idx_recipe_meal_type
+ON recipes(meal_type);
+
+CREATE INDEX IF NOT EXISTS idx_recipes_name
+ON recipes(name COLLATE NOCASE);
+
+CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_recipe
+ON recipe_ingredients(recipe_id);
+
+CREATE INDEX IF NOT EXISTS idx_pantry_ingredient
+ON pantry(ingredient_id);
+
+COMMIT;
+"""
+
+# WAL mode is persistent in the database file, so it only needs setting once
+_journal_mode_set = False
+
+# One cached connection per thread, closed at interpreter exit
+_local = threading.local()
+_connections: List[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+
+# Rows per executemany call in execute_many
+EXECUTE_MANY_CHUNK = 500
+
+# Unique savepoint names for the transaction decorator
+_savepoint_ids = itertools.count()
 
 
 def get_connection() -> sqlite3.Connection:
     """
-    Get database connection with row factory.
+    Get the cached database connection for the current thread.
+
+    The connection is opened on first use and reused afterwards, so callers
+    must not close it. It runs in autocommit mode: single statements commit
+    on their own, and multi-statement writes must start with BEGIN. Under
+    WAL each thread's connection reads concurrently with the one writer;
+    SQLite's own write lock serializes the writers.
 
     Returns:
         sqlite3.Connection: Database connection with row factory enabled
     """
-    # Ensure data directory exists
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _local.conn = _open_connection()
+    return conn
+
 
-    conn = sqlite3.connect(DATABASE_PATH)
+def _open_connection() -> sqlite3.Connection:
+    """
+    Open and configure a new connection, tracked for close_connections().
+
+    Returns:
+        sqlite3.Connection: Configured database connection
+    """
+    # Larger statement cache so hot queries are only parsed and planned once.
+    # Autocommit mode: multi-statement writes open their own BEGIN, so the
+    # module never has to inspect statements to issue implicit transactions.
+    conn = sqlite3.connect(
+        DATABASE_PATH_STR,
+        check_same_thread=False,
+        cached_statements=512,
+        isolation_level=None
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    _apply_pragmas(conn)
+
+    with _connections_lock:
+        _connections.append(conn)
     return conn
 
 
-def load_default_recipes() -> None:
-    """Load default everyday recipes if database is empty."""
-    from models import Recipe, RecipeIngredient
-    from recipe_manager import add_recipe, get_all_recipes
+def close_connections() -> None:
+    """Close every cached connection (registered to run at exit)."""
+    with _connections_lock:
+        while _connections:
+            _connections.pop().close()
+    _local.__dict__.pop('conn', None)
 
-    # Check if there are already recipes
-    existing_recipes = get_all_recipes()
-    if existing_recipes:
-        return  # Don't add defaults if recipes already exist
 
-    default_recipes = [
-        # Breakfast Recipes
-        Recipe(
-            name="Scrambled Eggs with Toast",
-            meal_type="breakfast",
-            servings=2,
-            prep_time=5,
-            cook_time=10,
-            cuisine="American",
-            ingredients=[
-                RecipeIngredient(ingredient_name="eggs", quantity=4, unit="whole"),
-                RecipeIngredient(ingredient_name="butter", quantity=1, unit="tbsp"),
-                RecipeIngredient(ingredient_name="bread", quantity=4, unit="slices"),
-                RecipeIngredient(ingredient_name="milk", quantity=2, unit="tbsp"),
-                RecipeIngredient(ingredient_name="salt", quantity=0.25, unit="tsp"),
-                RecipeIngredient(ingredient_name="black pepper", quantity=0.125, unit="tsp"),
-            ],
-            instructions="1. Beat eggs with milk, salt, and pepper.\n2. Melt butter in pan over medium heat.\n3. Pour in eggs and gently stir until cooked.\n4. Toast bread and serve with eggs.",
-            dietary_tags=["vegetarian"]
-        ),
-        Recipe(
-            name="Oatmeal with Berries",
-            meal_type="breakfast",
-            servings=2,
-            prep_time=5,
-            cook_time=10,
-            cuisine="American",
-            ingredients=[
-                RecipeIngredient(ingredient_name="rolled oats", quantity=1, unit="cup"),
-                RecipeIngredient(ingredient_name="water", quantity=2, unit="cups"),
-                RecipeIngredient(ingredient_name="blueberries", quantity=0.5, unit="cup"),
-                RecipeIngredient(ingredient_name="strawberries", quantity=0.5, unit="cup", preparation="sliced"),
-                RecipeIngredient(ingredient_name="honey", quantity=2, unit="tbsp"),
-                RecipeIngredient(ingredient_name="cinnamon", quantity=0.5, unit="tsp"),
-            ],
-            instructions="1. Bring water to boil in a pot.\n2. Add oats and reduce heat to medium.\n3. Cook for 5-7 minutes, stirring occasionally.\n4. Remove from heat and stir in cinnamon.\n5. Top with berries and drizzle with honey.",
-            dietary_tags=["vegetarian", "vegan"]
-        ),
-        # Lunch Recipes
-        Recipe(
-            name="Grilled Cheese Sandwich",
-            meal_type="lunch",
-            servings=2,
-            prep_time=5,
-            cook_time=10,
-            cuisine="American",
-            ingredients=[
-                RecipeIngredient(ingredient_name="bread", quantity=4, unit="slices"),
-                RecipeIngredient(ingredient_name="cheddar cheese", quantity=4, unit="slices"),
-                RecipeIngredient(ingredient_name="butter", quantity=2, unit="tbsp"),
-            ],
-            instructions="1. Butter one side of each bread slice.\n2. Place cheese between bread slices, butter side out.\n3. Heat skillet over medium heat.\n4. Cook sandwich until golden brown on each side and cheese is melted, about 3-4 minutes per side.",
-            dietary_tags=["vegetarian"]
-        ),
-        Recipe(
-            name="Chicken Caesar Salad",
-            meal_type="lunch",
-            servings=2,
-            prep_time=15,
-            cook_time=15,
-            cuisine="American",
-            ingredients=[
-                RecipeIngredient(ingredient_name="chicken breast", quantity=1, unit="lb"),
-                RecipeIngredient(ingredient_name="romaine lettuce", quantity=1, unit="head", preparation="chopped"),
-                RecipeIngredient(ingredient_name="parmesan cheese", quantity=0.5, unit="cup", preparation="grated"),
-                RecipeIngredient(ingredient_name="Caesar dressing", quantity=0.5, unit="cup"),
-                RecipeIngredient(ingredient_name="croutons", quantity=1, unit="cup"),
-                RecipeIngredient(ingredient_name="olive oil", quantity=1, unit="tbsp"),
-            ],
-            instructions="1. Season chicken with salt and pepper.\n2. Heat olive oil in pan and cook chicken 6-7 minutes per side.\n3. Let chicken rest 5 minutes, then slice.\n4. Toss lettuce with dressing and parmesan.\n5. Top with sliced chicken and croutons.",
-            dietary_tags=[]
-        ),
-        # Dinner Recipes
-        Recipe(
-            name="Spaghetti with Marinara",
-            meal_type="dinner",
-            servings=4,
-            prep_time=10,
-            cook_time=25,
-            cuisine="Italian",
-            ingredients=[
-                RecipeIngredient(ingredient_name="spaghetti", quantity=1, unit="lb"),
-                RecipeIngredient(ingredient_name="crushed tomatoes", quantity=28, unit="oz"),
-                RecipeIngredient(ingredient_name="garlic", quantity=4, unit="cloves", preparation="minced"),
-                RecipeIngredient(ingredient_name="olive oil", quantity=3, unit="tbsp"),
-                RecipeIngredient(ingredient_name="basil", quantity=0.25, unit="cup", preparation="fresh, chopped"),
-                RecipeIngredient(ingredient_name="salt", quantity=1, unit="tsp"),
-                RecipeIngredient(ingredient_name="black pepper", quantity=0.5, unit="tsp"),
-            ],
-            instructions="1. Cook spaghetti according to package directions.\n2. Heat olive oil in large pan over medium heat.\n3. Add garlic and cook until fragrant, about 1 minute.\n4. Add crushed tomatoes, salt, pepper, and half the basil.\n5. Simmer for 15 minutes.\n6. Toss pasta with sauce and garnish with remaining basil.",
-            dietary_tags=["vegetarian", "vegan"]
-        ),
-        Recipe(
-            name="Baked Chicken with Vegetables",
-            meal_type="dinner",
-            servings=4,
-            prep_time=15,
-            cook_time=40,
-            cuisine="American",
-            ingredients=[
-                RecipeIngredient(ingredient_name="chicken thighs", quantity=2, unit="lbs"),
-                RecipeIngredient(ingredient_name="potatoes", quantity=1, unit="lb", preparation="cubed"),
-                RecipeIngredient(ingredient_name="carrots", quantity=3, unit="whole", preparation="sliced"),
-                RecipeIngredient(ingredient_name="onion", quantity=1, unit="whole", preparation="quartered"),
-                RecipeIngredient(ingredient_name="olive oil", quantity=3, unit="tbsp"),
-                RecipeIngredient(ingredient_name="garlic powder", quantity=1, unit="tsp"),
-                RecipeIngredient(ingredient_name="paprika", quantity=1, unit="tsp"),
-                RecipeIngredient(ingredient_name="salt", quantity=1, unit="tsp"),
-                RecipeIngredient(ingredient_name="black pepper", quantity=0.5, unit="tsp"),
-            ],
-            instructions="1. Preheat oven to 425°F (220°C).\n2. Arrange vegetables in large baking dish.\n3. Drizzle with 2 tbsp olive oil and season with salt and pepper.\n4. Place chicken on top of vegetables.\n5. Rub chicken with remaining oil and season with garlic powder, paprika, salt, and pepper.\n6. Bake for 35-40 minutes until chicken reaches 165°F internal temperature.",
-            dietary_tags=[]
-        ),
-        # Snack Recipes
-        Recipe(
-            name="Fruit Smoothie",
-            meal_type="snack",
-            servings=2,
-            prep_time=5,
-            cook_time=0,
-            cuisine="American",
-            ingredients=[
-                RecipeIngredient(ingredient_name="banana", quantity=1, unit="whole"),
-                RecipeIngredient(ingredient_name="strawberries", quantity=1, unit="cup"),
-                RecipeIngredient(ingredient_name="yogurt", quantity=1, unit="cup"),
-                RecipeIngredient(ingredient_name="milk", quantity=0.5, unit="cup"),
-                RecipeIngredient(ingredient_name="honey", quantity=1, unit="tbsp"),
-            ],
-            instructions="1. Add all ingredients to blender.\n2. Blend until smooth.\n3. Pour into glasses and serve immediately.",
-            dietary_tags=["vegetarian"]
-        ),
-        Recipe(
-            name="Hummus with Veggies",
-            meal_type="snack",
-            servings=4,
-            prep_time=10,
-            cook_time=0,
-            cuisine="Mediterranean",
-            ingredients=[
-                RecipeIngredient(ingredient_name="chickpeas", quantity=15, unit="oz", preparation="drained"),
-                RecipeIngredient(ingredient_name="tahini", quantity=0.25, unit="cup"),
-                RecipeIngredient(ingredient_name="lemon juice", quantity=3, unit="tbsp"),
-                RecipeIngredient(ingredient_name="garlic", quantity=2, unit="cloves"),
-                RecipeIngredient(ingredient_name="olive oil", quantity=2, unit="tbsp"),
-                RecipeIngredient(ingredient_name="carrots", quantity=2, unit="whole", preparation="cut into sticks"),
-                RecipeIngredient(ingredient_name="celery", quantity=3, unit="stalks", preparation="cut into sticks"),
-            ],
-            instructions="1. In food processor, combine chickpeas, tahini, lemon juice, garlic, and olive oil.\n2. Blend until smooth, adding water if needed.\n3. Transfer to serving bowl.\n4. Serve with carrot and celery sticks.",
-            dietary_tags=["vegetarian", "vegan"]
-        ),
-    ]
-
-    # Add each default recipe
-    for recipe in default_recipes:
-        try:
-            add_recipe(recipe)
-        except Exception as e:
-            print(f"Warning: Could not add default recipe '{recipe.name}': {e}")
+atexit.register(close_connections)
 
 
-def initialize_database() -> None:
-    """Create tables if they don't exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """
+    Apply performance PRAGMAs to a new connection.
 
-    # Create recipes table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS recipes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            meal_type TEXT NOT NULL CHECK(meal_type IN ('breakfast', 'lunch', 'dinner', 'snack')),
-            prep_time INTEGER DEFAULT 0,
-            cook_time INTEGER DEFAULT 0,
-            servings INTEGER NOT NULL DEFAULT 4,
-            cuisine TEXT DEFAULT '',
-            instructions TEXT DEFAULT '',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    WAL journaling with synchronous=NORMAL avoids the double fsync of the
+    default rollback journal on every commit.
 
-    # Create ingredients table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS ingredients (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            category TEXT DEFAULT 'Other'
-        )
-    """)
+    Args:
+        conn: Freshly opened database connection
+    """
+    global _journal_mode_set
 
-    # Create recipe_ingredients junction table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS recipe_ingredients (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            recipe_id INTEGER NOT NULL,
-            ingredient_id INTEGER NOT NULL,
-            quantity REAL NOT NULL,
-            unit TEXT NOT NULL,
-            preparation TEXT DEFAULT '',
-            FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE,
-            FOREIGN KEY (ingredient_id) REFERENCES ingredients(id)
-        )
-    """)
+    if not _journal_mode_set:
+        mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        _journal_mode_set = mode.lower() == "wal"
 
-    # Create pantry table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS pantry (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            ingredient_id INTEGER NOT NULL,
-            quantity REAL NOT NULL,
-            unit TEXT NOT NULL,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (ingredient_id) REFERENCES ingredients(id),
-            UNIQUE(ingredient_id, unit)
-        )
-    """)
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -64000")
+    conn.execute("PRAGMA mmap_size = 268435456")
 
-    # Create current_meal_plan table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS current_meal_plan (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            day_number INTEGER NOT NULL CHECK(day_number BETWEEN 1 AND 7),
-            meal_type TEXT NOT NULL CHECK(meal_type IN ('breakfast', 'lunch', 'dinner', 'snack')),
-            recipe_id INTEGER NOT NULL,
-            servings INTEGER NOT NULL DEFAULT 2,
-            FOREIGN KEY (recipe_id) REFERENCES recipes(id),
-            UNIQUE(day_number, meal_type)
-        )
-    """)
 
-    # Create dietary_tags table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS dietary_tags (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            recipe_id INTEGER NOT NULL,
-            tag TEXT NOT NULL,
-            FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE,
-            UNIQUE(recipe_id, tag)
-        )
-    """)
+def load_default_recipes() -> None:
+    """Load default everyday recipes if database is empty."""
+    conn = get_connection()
 
-    # Create indexes for performance
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_recipe_meal_type
-        ON recipes(meal_type)
-    """)
+    # Check if there are already recipes
+    if conn.execute("SELECT 1 FROM recipes LIMIT 1").fetchone():
+        return  # Don't add defaults if recipes already exist
 
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_recipe
-        ON recipe_ingredients(recipe_id)
-    """)
+    # The seed script inserts everything in one transaction on the C side
+    try:
+        conn.executescript(DEFAULT_RECIPES_PATH.read_text(encoding='utf-8'))
+    except (OSError, sqlite3.Error) as e:
+        if conn.in_transaction:
+            conn.rollback()
+        print(f"Warning: Could not add default recipes: {e}")
+        return
 
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_pantry_ingredient
-        ON pantry(ingredient_id)
-    """)
+    # Gather planner statistics once, now that the tables have data
+    conn.execute("ANALYZE")
 
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_dietary_tags_recipe
-        ON dietary_tags(recipe_id)
+
+def _migrate_schema(conn: sqlite3.Connection) -> None:
+    """
+    Upgrade tables created by older versions to the current layout.
+
+    Args:
+        conn: Database connection
+    """
+    # Indexes from earlier versions that no query plan ever used; they only
+    # cost extra writes
+    conn.executescript("""
+        DROP INDEX IF EXISTS idx_ri_covering;
+        DROP INDEX IF EXISTS idx_pantry_ing_unit;
+        DROP INDEX IF EXISTS idx_meal_plan_recipe;
     """)
 
-    conn.commit()
-    conn.close()
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(dietary_tags)")]
+
+    # dietary_tags used to have a surrogate id and a separate UNIQUE index
+    if 'id' in columns:
+        conn.executescript("""
+            BEGIN;
+            CREATE TABLE dietary_tags_new (
+                recipe_id INTEGER NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (recipe_id, tag),
+                FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
+            ) WITHOUT ROWID;
+            INSERT INTO dietary_tags_new (recipe_id, tag)
+            SELECT recipe_id, tag FROM dietary_tags;
+            DROP TABLE dietary_tags;
+            ALTER TABLE dietary_tags_new RENAME TO dietary_tags;
+            COMMIT;
+        """)
+
+
+def initialize_database() -> None:
+    """Create tables if they don't exist."""
+    conn = get_connection()
+    conn.executescript(SCHEMA_SQL)
+    _migrate_schema(conn)
 
     # Load default recipes if database is empty
     load_default_recipes()
 
+    # Let SQLite refresh planner statistics only where they have gone stale,
+    # instead of a full ANALYZE on every start
+    conn.execute("PRAGMA optimize=0x10002")
+
 
-def execute_query(query: str, params: tuple = ()) -> List[sqlite3.Row]:
+def execute_query(
+    query: str,
+    params: tuple = (),
+    row_factory: Optional[Any] = sqlite3.Row
+) -> List[Any]:
     """
     Execute SELECT query and return results.
 
     Args:
         query: SQL SELECT query
         params: Query parameters
+        row_factory: Row factory for this query only; None returns plain
+            tuples, which is cheaper when callers only index positionally
 
     Returns:
-        List of Row objects
+        List of Row objects (or tuples when row_factory is None)
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
+    cursor.row_factory = row_factory
     cursor.execute(query, params)
-    results = cursor.fetchall()
-    conn.close()
-    return results
+    return cursor.fetchall()
 
 
 def execute_command(query: str, params: tuple = ()) -> int:
@@ -347,21 +334,30 @@ def execute_command(query: str, params: tuple = ()) -> int:
     Returns:
         Last inserted row ID for INSERT, affected rows for UPDATE/DELETE
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    # lastrowid keeps the last INSERT's value on a reused connection, so the
+    # statement type (not lastrowid itself) decides what to return
+    op = query.lstrip()[:7].upper()
+
+    # Autocommit: the statement commits on its own, or becomes part of the
+    # caller's transaction when one is open
+    cursor = get_connection().cursor()
     cursor.execute(query, params)
-    conn.commit()
 
     # Return lastrowid for INSERT, rowcount for UPDATE/DELETE
-    result = cursor.lastrowid if cursor.lastrowid > 0 else cursor.rowcount
-    conn.close()
-    return result
+    if op.startswith("INSERT"):
+        return cursor.lastrowid
+    return cursor.rowcount
 
 
 def execute_many(query: str, params_list: List[tuple]) -> int:
     """
     Execute multiple commands with different parameters.
 
+    Parameters are fed to executemany in slices of EXECUTE_MANY_CHUNK rows,
+    all inside one BEGIN IMMEDIATE transaction. Called inside an open
+    transaction (e.g. from a @transaction function), the batch runs in its
+    own savepoint instead and the caller keeps control of the commit.
+
     Args:
         query: SQL command
         params_list: List of parameter tuples
@@ -371,27 +367,69 @@ def execute_many(query: str, params_list: List[tuple]) -> int:
     """
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.executemany(query, params_list)
-    conn.commit()
-    result = cursor.rowcount
-    conn.close()
+
+    savepoint = None
+    if conn.in_transaction:
+        savepoint = f"sp_{next(_savepoint_ids)}"
+        conn.execute(f"SAVEPOINT {savepoint}")
+    else:
+        # Take the write lock up front so WAL never has to upgrade mid-batch
+        conn.execute("BEGIN IMMEDIATE")
+
+    result = 0
+    try:
+        for start in range(0, len(params_list), EXECUTE_MANY_CHUNK):
+            cursor.executemany(query, params_list[start:start + EXECUTE_MANY_CHUNK])
+            result += max(cursor.rowcount, 0)
+        if savepoint:
+            conn.execute(f"RELEASE {savepoint}")
+        else:
+            conn.commit()
+    except Exception as e:
+        if savepoint:
+            conn.execute(f"ROLLBACK TO {savepoint}")
+            conn.execute(f"RELEASE {savepoint}")
+        else:
+            conn.rollback()
+        raise e
+
     return result
 
 
 def transaction(func):
     """
     Decorator for database transactions.
-    Automatically commits on success and rolls back on error.
+    Calls func(conn, *args, **kwargs) with the thread's connection inside a
+    BEGIN IMMEDIATE transaction, committing on success and rolling back on
+    error. Called inside an open transaction, the call runs in its own
+    savepoint instead, so decorated functions may call each other; they must
+    not call conn.commit() themselves.
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         conn = get_connection()
+
+        savepoint = None
+        if conn.in_transaction:
+            savepoint = f"sp_{next(_savepoint_ids)}"
+            conn.execute(f"SAVEPOINT {savepoint}")
+        else:
+            # Take the write lock up front so WAL never has to upgrade from
+            # a read partway through the function
+            conn.execute("BEGIN IMMEDIATE")
+
         try:
             result = func(conn, *args, **kwargs)
-            conn.commit()
+            if savepoint:
+                conn.execute(f"RELEASE {savepoint}")
+            else:
+                conn.commit()
             return result
         except Exception as e:
-            conn.rollback()
+            if savepoint:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            else:
+                conn.rollback()
             raise e
-        finally:
-            conn.close()
     return wrapper
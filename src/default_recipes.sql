@@ -0,0 +1,166 @@
+-- Default everyday recipes, loaded into an empty database by load_default_recipes().
+-- Runs as a single script so the whole seed is one transaction on the C side.
+
+BEGIN;
+
+INSERT INTO recipes (name, meal_type, prep_time, cook_time, servings, cuisine, instructions) VALUES
+    ('Scrambled Eggs with Toast', 'breakfast', 5, 10, 2, 'American',
+     '1. Beat eggs with milk, salt, and pepper.
+2. Melt butter in pan over medium heat.
+3. Pour in eggs and gently stir until cooked.
+4. Toast bread and serve with eggs.'),
+    ('Oatmeal with Berries', 'breakfast', 5, 10, 2, 'American',
+     '1. Bring water to boil in a pot.
+2. Add oats and reduce heat to medium.
+3. Cook for 5-7 minutes, stirring occasionally.
+4. Remove from heat and stir in cinnamon.
+5. Top with berries and drizzle with honey.'),
+    ('Grilled Cheese Sandwich', 'lunch', 5, 10, 2, 'American',
+     '1. Butter one side of each bread slice.
+2. Place cheese between bread slices, butter side out.
+3. Heat skillet over medium heat.
+4. Cook sandwich until golden brown on each side and cheese is melted, about 3-4 minutes per side.'),
+    ('Chicken Caesar Salad', 'lunch', 15, 15, 2, 'American',
+     '1. Season chicken with salt and pepper.
+2. Heat olive oil in pan and cook chicken 6-7 minutes per side.
+3. Let chicken rest 5 minutes, then slice.
+4. Toss lettuce with dressing and parmesan.
+5. Top with sliced chicken and croutons.'),
+    ('Spaghetti with Marinara', 'dinner', 10, 25, 4, 'Italian',
+     '1. Cook spaghetti according to package directions.
+2. Heat olive oil in large pan over medium heat.
+3. Add garlic and cook until fragrant, about 1 minute.
+4. Add crushed tomatoes, salt, pepper, and half the basil.
+5. Simmer for 15 minutes.
+6. Toss pasta with sauce and garnish with remaining basil.'),
+    ('Baked Chicken with Vegetables', 'dinner', 15, 40, 4, 'American',
+     '1. Preheat oven to 425°F (220°C).
+2. Arrange vegetables in large baking dish.
+3. Drizzle with 2 tbsp olive oil and season with salt and pepper.
+4. Place chicken on top of vegetables.
+5. Rub chicken with remaining oil and season with garlic powder, paprika, salt, and pepper.
+6. Bake for 35-40 minutes until chicken reaches 165°F internal temperature.'),
+    ('Fruit Smoothie', 'snack', 5, 0, 2, 'American',
+     '1. Add all ingredients to blender.
+2. Blend until smooth.
+3. Pour into glasses and serve immediately.'),
+    ('Hummus with Veggies', 'snack', 10, 0, 4, 'Mediterranean',
+     '1. In food processor, combine chickpeas, tahini, lemon juice, garlic, and olive oil.
+2. Blend until smooth, adding water if needed.
+3. Transfer to serving bowl.
+4. Serve with carrot and celery sticks.');
+
+INSERT INTO ingredients (name, category) VALUES
+    ('eggs', 'Dairy & Eggs'),
+    ('butter', 'Dairy & Eggs'),
+    ('bread', 'Bakery'),
+    ('milk', 'Dairy & Eggs'),
+    ('salt', 'Pantry'),
+    ('black pepper', 'Pantry'),
+    ('rolled oats', 'Pantry'),
+    ('water', 'Other'),
+    ('blueberries', 'Other'),
+    ('strawberries', 'Other'),
+    ('honey', 'Pantry'),
+    ('cinnamon', 'Other'),
+    ('cheddar cheese', 'Dairy & Eggs'),
+    ('chicken breast', 'Meat & Seafood'),
+    ('romaine lettuce', 'Produce'),
+    ('parmesan cheese', 'Dairy & Eggs'),
+    ('caesar dressing', 'Other'),
+    ('croutons', 'Other'),
+    ('olive oil', 'Pantry'),
+    ('spaghetti', 'Pantry'),
+    ('crushed tomatoes', 'Other'),
+    ('garlic', 'Produce'),
+    ('basil', 'Produce'),
+    ('chicken thighs', 'Meat & Seafood'),
+    ('potatoes', 'Produce'),
+    ('carrots', 'Produce'),
+    ('onion', 'Produce'),
+    ('garlic powder', 'Other'),
+    ('paprika', 'Other'),
+    ('banana', 'Produce'),
+    ('yogurt', 'Dairy & Eggs'),
+    ('chickpeas', 'Other'),
+    ('tahini', 'Other'),
+    ('lemon juice', 'Other'),
+    ('celery', 'Produce')
+ON CONFLICT(name) DO NOTHING;
+
+WITH v(recipe, ingredient, quantity, unit, preparation) AS (VALUES
+    ('Scrambled Eggs with Toast', 'eggs', 4, 'whole', ''),
+    ('Scrambled Eggs with Toast', 'butter', 1, 'tbsp', ''),
+    ('Scrambled Eggs with Toast', 'bread', 4, 'slices', ''),
+    ('Scrambled Eggs with Toast', 'milk', 2, 'tbsp', ''),
+    ('Scrambled Eggs with Toast', 'salt', 0.25, 'tsp', ''),
+    ('Scrambled Eggs with Toast', 'black pepper', 0.125, 'tsp', ''),
+    ('Oatmeal with Berries', 'rolled oats', 1, 'cup', ''),
+    ('Oatmeal with Berries', 'water', 2, 'cups', ''),
+    ('Oatmeal with Berries', 'blueberries', 0.5, 'cup', ''),
+    ('Oatmeal with Berries', 'strawberries', 0.5, 'cup', 'sliced'),
+    ('Oatmeal with Berries', 'honey', 2, 'tbsp', ''),
+    ('Oatmeal with Berries', 'cinnamon', 0.5, 'tsp', ''),
+    ('Grilled Cheese Sandwich', 'bread', 4, 'slices', ''),
+    ('Grilled Cheese Sandwich', 'cheddar cheese', 4, 'slices', ''),
+    ('Grilled Cheese Sandwich', 'butter', 2, 'tbsp', ''),
+    ('Chicken Caesar Salad', 'chicken breast', 1, 'lb', ''),
+    ('Chicken Caesar Salad', 'romaine lettuce', 1, 'head', 'chopped'),
+    ('Chicken Caesar Salad', 'parmesan cheese', 0.5, 'cup', 'grated'),
+    ('Chicken Caesar Salad', 'caesar dressing', 0.5, 'cup', ''),
+    ('Chicken Caesar Salad', 'croutons', 1, 'cup', ''),
+    ('Chicken Caesar Salad', 'olive oil', 1, 'tbsp', ''),
+    ('Spaghetti with Marinara', 'spaghetti', 1, 'lb', ''),
+    ('Spaghetti with Marinara', 'crushed tomatoes', 28, 'oz', ''),
+    ('Spaghetti with Marinara', 'garlic', 4, 'cloves', 'minced'),
+    ('Spaghetti with Marinara', 'olive oil', 3, 'tbsp', ''),
+    ('Spaghetti with Marinara', 'basil', 0.25, 'cup', 'fresh, chopped'),
+    ('Spaghetti with Marinara', 'salt', 1, 'tsp', ''),
+    ('Spaghetti with Marinara', 'black pepper', 0.5, 'tsp', ''),
+    ('Baked Chicken with Vegetables', 'chicken thighs', 2, 'lbs', ''),
+    ('Baked Chicken with Vegetables', 'potatoes', 1, 'lb', 'cubed'),
+    ('Baked Chicken with Vegetables', 'carrots', 3, 'whole', 'sliced'),
+    ('Baked Chicken with Vegetables', 'onion', 1, 'whole', 'quartered'),
+    ('Baked Chicken with Vegetables', 'olive oil', 3, 'tbsp', ''),
+    ('Baked Chicken with Vegetables', 'garlic powder', 1, 'tsp', ''),
+    ('Baked Chicken with Vegetables', 'paprika', 1, 'tsp', ''),
+    ('Baked Chicken with Vegetables', 'salt', 1, 'tsp', ''),
+    ('Baked Chicken with Vegetables', 'black pepper', 0.5, 'tsp', ''),
+    ('Fruit Smoothie', 'banana', 1, 'whole', ''),
+    ('Fruit Smoothie', 'strawberries', 1, 'cup', ''),
+    ('Fruit Smoothie', 'yogurt', 1, 'cup', ''),
+    ('Fruit Smoothie', 'milk', 0.5, 'cup', ''),
+    ('Fruit Smoothie', 'honey', 1, 'tbsp', ''),
+    ('Hummus with Veggies', 'chickpeas', 15, 'oz', 'drained'),
+    ('Hummus with Veggies', 'tahini', 0.25, 'cup', ''),
+    ('Hummus with Veggies', 'lemon juice', 3, 'tbsp', ''),
+    ('Hummus with Veggies', 'garlic', 2, 'cloves', ''),
+    ('Hummus with Veggies', 'olive oil', 2, 'tbsp', ''),
+    ('Hummus with Veggies', 'carrots', 2, 'whole', 'cut into sticks'),
+    ('Hummus with Veggies', 'celery', 3, 'stalks', 'cut into sticks')
+)
+INSERT INTO recipe_ingredients (recipe_id, ingredient_id, quantity, unit, preparation)
+SELECT r.id, i.id, v.quantity, v.unit, v.preparation
+FROM v
+CROSS JOIN recipes r
+CROSS JOIN ingredients i
+WHERE r.name = v.recipe AND i.name = v.ingredient;
+
+WITH v(recipe, tag) AS (VALUES
+    ('Scrambled Eggs with Toast', 'vegetarian'),
+    ('Oatmeal with Berries', 'vegetarian'),
+    ('Oatmeal with Berries', 'vegan'),
+    ('Grilled Cheese Sandwich', 'vegetarian'),
+    ('Spaghetti with Marinara', 'vegetarian'),
+    ('Spaghetti with Marinara', 'vegan'),
+    ('Fruit Smoothie', 'vegetarian'),
+    ('Hummus with Veggies', 'vegetarian'),
+    ('Hummus with Veggies', 'vegan')
+)
+INSERT INTO dietary_tags (recipe_id, tag)
+SELECT r.id, v.tag
+FROM v
+CROSS JOIN recipes r
+WHERE r.name = v.recipe;
+
+COMMIT;
@@ -17,6 +17,26 @@ from utils import (
 )
 from pantry_manager import get_pantry_items, deduct_from_pantry
 
+# Export files are written through a 64 KB buffer, so even a long list is
+# flushed in a handful of writes instead of one per 8 KB default buffer
+EXPORT_BUFFER_SIZE = 1 << 16
+
+# Store-aisle order of grocery categories, mapped to their sort position.
+# Unknown categories sort after all of these.
+CATEGORY_ORDER = {
+    category: position for position, category in enumerate((
+        "Produce",
+        "Meat & Seafood",
+        "Dairy & Eggs",
+        "Bakery",
+        "Pantry",
+        "Canned Goods",
+        "Condiments",
+        "Frozen",
+        "Other",
+    ))
+}
+
 
 def generate_grocery_list(
     meal_plan: MealPlan,
@@ -61,25 +81,8 @@ def generate_grocery_list(
         grocery_items = _deduct_pantry_from_list(grocery_items)
 
     # Sort by category
-    category_order = [
-        "Produce",
-        "Meat & Seafood",
-        "Dairy & Eggs",
-        "Bakery",
-        "Pantry",
-        "Canned Goods",
-        "Condiments",
-        "Frozen",
-        "Other"
-    ]
-
-    def sort_key(item):
-        try:
-            return category_order.index(item.category)
-        except ValueError:
-            return len(category_order)
-
-    grocery_items.sort(key=sort_key)
+    unknown = len(CATEGORY_ORDER)
+    grocery_items.sort(key=lambda item: CATEGORY_ORDER.get(item.category, unknown))
 
     return grocery_items
 
@@ -168,12 +171,9 @@ def _deduct_pantry_from_list(grocery_items: List[GroceryItem]) -> List[GroceryIt
         return grocery_items
 
     # Create a map of pantry items by normalized name
-    pantry_map = {}
+    pantry_map: Dict[str, List] = defaultdict(list)
     for item in pantry_items:
-        normalized = normalize_ingredient_name(item.ingredient_name)
-        if normalized not in pantry_map:
-            pantry_map[normalized] = []
-        pantry_map[normalized].append(item)
+        pantry_map[normalize_ingredient_name(item.ingredient_name)].append(item)
 
     # Process each grocery item
     updated_items = []
@@ -227,7 +227,8 @@ def _deduct_pantry_from_list(grocery_items: List[GroceryItem]) -> List[GroceryIt
 def export_grocery_list(
     items: List[GroceryItem],
     format: str = "txt",
-    output_path: str = None
+    output_path: str = None,
+    buffering: int = EXPORT_BUFFER_SIZE
 ) -> str:
     """
     Export grocery list to file.
@@ -241,6 +242,7 @@ def export_grocery_list(
         items: List of GroceryItem objects
         format: Export format (txt, md, json)
         output_path: Output file path (default: exports/grocery_list.{format})
+        buffering: Write buffer size in bytes for the output file
 
     Returns:
         Path to exported file
@@ -251,21 +253,17 @@ def export_grocery_list(
     # Ensure exports directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    if format == "txt":
-        _export_txt(items, output_path)
-    elif format == "md":
-        _export_markdown(items, output_path)
-    elif format == "json":
-        _export_json(items, output_path)
-    else:
+    exporter = _EXPORTERS.get(format)
+    if exporter is None:
         raise ValueError(f"Unsupported format: {format}")
+    exporter(items, output_path, buffering)
 
     return output_path
 
 
-def _export_txt(items: List[GroceryItem], output_path: str) -> None:
+def _export_txt(items: List[GroceryItem], output_path: str, buffering: int = EXPORT_BUFFER_SIZE) -> None:
     """Export as plain text."""
-    with open(output_path, 'w') as f:
+    with open(output_path, 'w', encoding='utf-8', buffering=buffering) as f:
         f.write("=" * 50 + "\n")
         f.write("GROCERY LIST\n")
         f.write("=" * 50 + "\n\n")
@@ -284,9 +282,9 @@ def _export_txt(items: List[GroceryItem], output_path: str) -> None:
         f.write(f"Total Items: {len(items)}\n")
 
 
-def _export_markdown(items: List[GroceryItem], output_path: str) -> None:
+def _export_markdown(items: List[GroceryItem], output_path: str, buffering: int = EXPORT_BUFFER_SIZE) -> None:
     """Export as markdown with checkboxes."""
-    with open(output_path, 'w') as f:
+    with open(output_path, 'w', encoding='utf-8', buffering=buffering) as f:
         f.write("# Grocery List\n\n")
 
         current_category = None
@@ -301,7 +299,7 @@ def _export_markdown(items: List[GroceryItem], output_path: str) -> None:
         f.write(f"\n---\n**Total Items:** {len(items)}\n")
 
 
-def _export_json(items: List[GroceryItem], output_path: str) -> None:
+def _export_json(items: List[GroceryItem], output_path: str, buffering: int = EXPORT_BUFFER_SIZE) -> None:
     """Export as JSON."""
     data = {
         'items': [
@@ -316,10 +314,19 @@ def _export_json(items: List[GroceryItem], output_path: str) -> None:
         'total_items': len(items)
     }
 
-    with open(output_path, 'w') as f:
+    with open(output_path, 'w', encoding='utf-8', buffering=buffering) as f:
         json.dump(data, f, indent=2)
 
 
+# Writer per export format; the format name doubles as the file extension
+_EXPORTERS = {
+    "txt": _export_txt,
+    "md": _export_markdown,
+    "json": _export_json,
+}
+EXPORT_FORMATS = tuple(_EXPORTERS)
+
+
 def get_grocery_summary(items: List[GroceryItem]) -> Dict[str, int]:
     """
     Get summary statistics for grocery list.
@@ -4,44 +4,225 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 from typing import Optional, List
+import re
+import sqlite3
 import sys
+import time
+import weakref
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 
-from models import Recipe, RecipeIngredient, PantryItem
-from database import initialize_database
+from models import Recipe, RecipeIngredient, PantryItem, MealPlan, MEAL_TYPES
+from database import initialize_database, find_data_file
 from recipe_manager import (
-    add_recipe, get_recipe, get_all_recipes, delete_recipe
+    add_recipe, get_all_recipes, delete_recipe
 )
 from pdf_exporter import export_recipes_to_pdf
 from meal_planner import (
     generate_meal_plan, get_current_plan, save_meal_plan,
     swap_meal, get_swap_suggestions, clear_meal_plan
 )
-from grocery_generator import generate_grocery_list, export_grocery_list
+from grocery_generator import generate_grocery_list, export_grocery_list, EXPORT_FORMATS
 from pantry_manager import (
-    add_pantry_item, get_pantry_items, update_pantry_quantity,
-    remove_pantry_item
+    add_pantry_item, add_pantry_items_bulk, get_pantry_items,
+    update_pantry_quantity, remove_pantry_item
 )
-from utils import parse_ingredient_string, format_quantity, get_ingredient_category
+from utils import parse_ingredient_string, format_quantity, get_ingredient_category, normalize_ingredient_name
+
+# Shared sort key, built once instead of a new lambda per refresh
+_INGREDIENT_NAME = attrgetter('ingredient_name')
+
+
+def _resolve_icon() -> Optional[str]:
+    """Locate the window icon next to this module, or None if it isn't shipped."""
+    icon_path = Path(__file__).with_name('cooking.ico')
+    return str(icon_path) if icon_path.is_file() else None
+
+
+# Probed once at import rather than on every window construction
+_ICON_PATH = _resolve_icon()
+
+# Cream theme color palette (read-only)
+COLORS = MappingProxyType({
+    'bg_dark': '#FFF8E7',        # Light cream background
+    'bg_medium': "#F5ECD7",      # Medium cream
+    'bg_light': "#FEFBF3",       # Lighter cream
+    'fg_primary': "#3E3022",     # Dark brown text
+    'fg_secondary': "#6B5D4F",   # Medium brown text
+    'accent': "#D4C4A8",         # Accent tan
+    'button': "#E8DCC8",         # Button background (cream)
+    'button_hover': "#D4C4A8",   # Button hover (darker tan)
+    'button_active': "#C9B697",  # Button active/pressed (darker tan)
+    'selected': "#D4C4A8",       # Selection color (tan)
+    'border': "#C9B697",         # Border color (tan)
+})
+
+# Shared widget options, built once for every read-out text area
+_SCROLLED_TEXT_KWARGS = dict(
+    wrap=tk.WORD,
+    font=('Arial', 11),
+    bg=COLORS['bg_medium'],
+    fg=COLORS['fg_primary'],
+    insertbackground=COLORS['fg_primary'],
+    selectbackground=COLORS['selected'],
+    selectforeground=COLORS['fg_primary'],
+    borderwidth=0,
+    highlightthickness=1,
+    highlightbackground=COLORS['border'],
+    highlightcolor=COLORS['border']
+)
+
+# Editable text areas in dialogs
+_INPUT_TEXT_KWARGS = dict(
+    bg=COLORS['bg_medium'],
+    fg=COLORS['fg_primary'],
+    insertbackground=COLORS['fg_primary'],
+    selectbackground=COLORS['selected'],
+    selectforeground=COLORS['fg_primary'],
+    borderwidth=1,
+    highlightthickness=0
+)
+
+# ttk style options for the cream theme, applied with style.configure / style.map
+_STYLE_CONFIGS = {
+    'TNotebook': dict(background=COLORS['bg_dark'], borderwidth=0),
+    'TNotebook.Tab': dict(background=COLORS['bg_medium'], foreground=COLORS['fg_primary'],
+                          padding=[20, 10], borderwidth=0),
+    'TFrame': dict(background=COLORS['bg_dark']),
+    'TLabelframe': dict(background=COLORS['bg_dark'], foreground=COLORS['fg_primary'],
+                        borderwidth=1, relief='solid'),
+    'TLabelframe.Label': dict(background=COLORS['bg_dark'], foreground=COLORS['fg_primary']),
+    'TLabel': dict(background=COLORS['bg_dark'], foreground=COLORS['fg_primary']),
+    'TButton': dict(background=COLORS['button'], foreground=COLORS['fg_primary'], borderwidth=1,
+                    focuscolor=COLORS['button_hover'], padding=[10, 5], relief='raised'),
+    'TCombobox': dict(fieldbackground=COLORS['bg_medium'], background=COLORS['bg_medium'],
+                      foreground=COLORS['fg_primary'], arrowcolor=COLORS['fg_primary'], borderwidth=1),
+    'TEntry': dict(fieldbackground=COLORS['bg_medium'], foreground=COLORS['fg_primary'], borderwidth=1),
+    'TCheckbutton': dict(background=COLORS['bg_dark'], foreground=COLORS['fg_primary']),
+    'TSpinbox': dict(fieldbackground=COLORS['bg_medium'], foreground=COLORS['fg_primary'],
+                     arrowcolor=COLORS['fg_primary'], borderwidth=1),
+    'Treeview': dict(background=COLORS['bg_medium'], fieldbackground=COLORS['bg_medium'],
+                     foreground=COLORS['fg_primary'], font=('Arial', 11), rowheight=24, borderwidth=0),
+    'Treeview.Heading': dict(background=COLORS['button'], foreground=COLORS['fg_primary']),
+}
+
+_STYLE_MAPS = {
+    'TNotebook.Tab': dict(
+        background=[('selected', COLORS['bg_light'])],
+        foreground=[('selected', COLORS['fg_primary'])]
+    ),
+    'TButton': dict(
+        background=[
+            ('active', COLORS['button_hover']),      # Hover - lighter
+            ('pressed', COLORS['button_active']),    # Pressed - darker
+            ('!active', COLORS['button'])            # Normal state
+        ],
+        foreground=[('active', COLORS['fg_primary'])],
+        relief=[
+            ('pressed', 'sunken'),
+            ('!pressed', 'raised')
+        ]
+    ),
+    'Treeview': dict(
+        background=[('selected', COLORS['selected'])],
+        foreground=[('selected', COLORS['fg_primary'])]
+    ),
+}
+
+# Tk roots whose interpreter already has the cream theme styles
+_THEMED_ROOTS = weakref.WeakSet()
+
+
+def _configure_theme_once(root: tk.Tk):
+    """
+    Configure ttk styles for the cream theme.
+
+    Styles are shared by every widget in a Tk interpreter, so this runs once
+    per root window; a new root (new interpreter) gets its own styles.
+    """
+    if root in _THEMED_ROOTS:
+        return
+
+    style = ttk.Style(root)
+    for name, opts in _STYLE_CONFIGS.items():
+        style.configure(name, **opts)
+    for name, opts in _STYLE_MAPS.items():
+        style.map(name, **opts)
+
+    _THEMED_ROOTS.add(root)
+
+
+# Meal plan icon per meal type
+_MEAL_ICONS = MappingProxyType({
+    'breakfast': '🍳',
+    'lunch': '🥗',
+    'dinner': '🍽️',
+    'snack': '🍪'
+})
+
+# Lines inserted per idle callback when _render_text writes a long text
+_TEXT_CHUNK_LINES = 100
+
+# Minimum seconds between forced status bar repaints (about 20 per second)
+_STATUS_FLUSH_INTERVAL = 0.05
+
+# Milliseconds a success message stays in the status bar
+_NOTIFY_CLEAR_MS = 3000
+
+# Recipe rows attached up front, and per batch as the list scrolls down
+_RECIPE_ROW_BATCH = 50
+
+# Help & Info tab contents, read only when the Help tab is first opened
+_HELP_PATH = find_data_file('help.txt')
+
+
+def _load_help() -> str:
+    """Read the Help & Info tab text, or a short notice if it isn't installed."""
+    try:
+        return _HELP_PATH.read_text(encoding='utf-8')
+    except OSError:
+        return "Help text is not available: help.txt was not installed with the application.\n"
+
+
+def _group_pantry_items(items: List[PantryItem]) -> dict:
+    """
+    Group pantry items into a sorted category -> items index.
+
+    Args:
+        items: Pantry items, ordered by ingredient name
+
+    Returns:
+        Dict of category to its items, with categories in sorted order
+    """
+    # Items arrive ordered by name, so a single append per item leaves each
+    # category's rows sorted; only the category names need sorting
+    by_category = defaultdict(list)
+    for item in items:
+        by_category[get_ingredient_category(item.ingredient_name)].append(item)
+    return dict(sorted(by_category.items()))
 
 
 class MealPlannerGUI:
     """Main GUI application class."""
 
-    # Cream theme color palette
-    COLORS = {
-        'bg_dark': '#FFF8E7',        # Light cream background
-        'bg_medium': "#F5ECD7",      # Medium cream
-        'bg_light': "#FEFBF3",       # Lighter cream
-        'fg_primary': "#3E3022",     # Dark brown text
-        'fg_secondary': "#6B5D4F",   # Medium brown text
-        'accent': "#D4C4A8",         # Accent tan
-        'button': "#E8DCC8",         # Button background (cream)
-        'button_hover': "#D4C4A8",   # Button hover (darker tan)
-        'button_active': "#C9B697",  # Button active/pressed (darker tan)
-        'selected': "#D4C4A8",       # Selection color (tan)
-        'border': "#C9B697",         # Border color (tan)
+    COLORS = COLORS
+
+    # Save-dialog options per export format
+    _EXPORT_EXTS = {fmt: f".{fmt}" for fmt in EXPORT_FORMATS}
+    _EXPORT_FILETYPES = {
+        fmt: ((f"{fmt.upper()} files", f"*{ext}"), ("All files", "*.*"))
+        for fmt, ext in _EXPORT_EXTS.items()
     }
+    _PDF_FILETYPES = (("PDF files", "*.pdf"), ("All files", "*.*"))
+    # A complete pantry quantity, and anything that can still grow into one
+    # while it is being typed
+    _QTY_RE = re.compile(r'\d+(?:\.\d*)?|\.\d+')
+    _QTY_PARTIAL_RE = re.compile(r'\d*\.?\d*')
+    _PANTRY_EMPTY = "empty"
 
     def __init__(self, root):
         self.root = root
@@ -49,35 +230,64 @@ class MealPlannerGUI:
         self.root.geometry("950x700")
 
         # Try to set cooking icon if available
-        try:
-            import os
-            icon_path = os.path.join(os.path.dirname(__file__), 'cooking.ico')
-            if os.path.exists(icon_path):
-                self.root.iconbitmap(default=icon_path)
-        except:
-            pass  # Icon file not found or not supported, will use default
+        if _ICON_PATH:
+            try:
+                self.root.iconbitmap(default=_ICON_PATH)
+            except (OSError, tk.TclError):
+                pass  # Icon format not supported on this platform, will use default
+
+        # All recipes (key None) and per-meal-type buckets of them, loaded in
+        # one query; cleared whenever recipes change
+        self._recipe_cache: dict = {}
+
+        # Last text rendered into each read-out Text widget, used to skip redraws,
+        # and the pending after_idle job of any render still being written
+        self._rendered_text: dict = {}
+        self._render_jobs: dict = {}
+
+        # Grocery lists for the current plan keyed by deduct_pantry; cleared
+        # whenever the plan, pantry or recipes change
+        self._grocery_cache: dict = {}
+        self._grocery_generation = 0
+
+        # Pending after() job that clears a success message from the status bar
+        self._notify_clear_id = None
+
+        # Add Recipe and Bulk Add dialogs, built on first use and then hidden/shown
+        self._add_recipe_dialog = None
+        self._bulk_pantry_dialog = None
+
+        # Worker threads for slow operations so the window keeps redrawing
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Apply cream theme to root window
         self.root.configure(bg=self.COLORS['bg_dark'])
 
-        # Initialize database
-        initialize_database()
-
         # Configure cream theme styles
-        self.configure_dark_theme()
+        _configure_theme_once(self.root)
 
         # Create notebook (tabbed interface)
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
 
-        # Create tabs
-        self.create_recipes_tab()
-        self.create_meal_plan_tab()
-        self.create_grocery_tab()
-        self.create_pantry_tab()
-        self.create_help_tab()
-
-        # Status bar
+        # Create tabs as empty placeholders; each one is built on first view
+        self._tab_builders = {}
+        for text, builder in (
+            ("Recipes", self.create_recipes_tab),
+            ("Meal Plan", self.create_meal_plan_tab),
+            ("Grocery List", self.create_grocery_tab),
+            ("Pantry", self.create_pantry_tab),
+            ("ℹ️ Help & Info", self.create_help_tab),
+        ):
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=text)
+            self._tab_builders[str(tab)] = builder
+        self._tab_changed_binding = None
+        self._pantry_prefetch = None
+
+        # Status bar; flushes are rate-limited, see set_status
+        self._last_status_flush = 0.0
         self.status_bar = tk.Label(
             root,
             text="Ready",
@@ -89,94 +299,231 @@ class MealPlannerGUI:
         )
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
-    def configure_dark_theme(self):
-        """Configure ttk styles for cream theme."""
-        style = ttk.Style()
-
-        # Configure Notebook (tabs)
-        style.configure('TNotebook', background=self.COLORS['bg_dark'], borderwidth=0)
-        style.configure('TNotebook.Tab',
-                       background=self.COLORS['bg_medium'],
-                       foreground=self.COLORS['fg_primary'],
-                       padding=[20, 10],
-                       borderwidth=0)
-        style.map('TNotebook.Tab',
-                 background=[('selected', self.COLORS['bg_light'])],
-                 foreground=[('selected', self.COLORS['fg_primary'])])
-
-        # Configure Frame
-        style.configure('TFrame', background=self.COLORS['bg_dark'])
-        style.configure('TLabelframe',
-                       background=self.COLORS['bg_dark'],
-                       foreground=self.COLORS['fg_primary'],
-                       borderwidth=1,
-                       relief='solid')
-        style.configure('TLabelframe.Label',
-                       background=self.COLORS['bg_dark'],
-                       foreground=self.COLORS['fg_primary'])
-
-        # Configure Labels
-        style.configure('TLabel',
-                       background=self.COLORS['bg_dark'],
-                       foreground=self.COLORS['fg_primary'])
-
-        # Configure Buttons with gradient effect
-        style.configure('TButton',
-                       background=self.COLORS['button'],
-                       foreground=self.COLORS['fg_primary'],
-                       borderwidth=1,
-                       focuscolor=self.COLORS['button_hover'],
-                       padding=[10, 5],
-                       relief='raised')
-        style.map('TButton',
-                 background=[
-                     ('active', self.COLORS['button_hover']),      # Hover - lighter
-                     ('pressed', self.COLORS['button_active']),    # Pressed - darker
-                     ('!active', self.COLORS['button'])            # Normal state
-                 ],
-                 foreground=[('active', self.COLORS['fg_primary'])],
-                 relief=[
-                     ('pressed', 'sunken'),
-                     ('!pressed', 'raised')
-                 ])
-
-        # Configure Combobox
-        style.configure('TCombobox',
-                       fieldbackground=self.COLORS['bg_medium'],
-                       background=self.COLORS['bg_medium'],
-                       foreground=self.COLORS['fg_primary'],
-                       arrowcolor=self.COLORS['fg_primary'],
-                       borderwidth=1)
-
-        # Configure Entry
-        style.configure('TEntry',
-                       fieldbackground=self.COLORS['bg_medium'],
-                       foreground=self.COLORS['fg_primary'],
-                       borderwidth=1)
-
-        # Configure Checkbutton
-        style.configure('TCheckbutton',
-                       background=self.COLORS['bg_dark'],
-                       foreground=self.COLORS['fg_primary'])
-
-        # Configure Spinbox
-        style.configure('TSpinbox',
-                       fieldbackground=self.COLORS['bg_medium'],
-                       foreground=self.COLORS['fg_primary'],
-                       arrowcolor=self.COLORS['fg_primary'],
-                       borderwidth=1)
-
-    def set_status(self, message: str):
-        """Update status bar message."""
+        # Open the database once the window has been drawn, so the first
+        # paint doesn't wait on schema setup or seeding
+        self.set_status("Initializing...")
+        self.root.after_idle(self._init_db_and_load)
+
+    def _init_db_and_load(self):
+        """Initialize the database, then build the selected tab and enable lazy tabs."""
+        try:
+            initialize_database()
+        except (sqlite3.Error, OSError) as e:
+            messagebox.showerror("Error", f"Failed to open the database: {e}")
+            self.root.destroy()
+            return
+
+        # Load the pantry on a worker; the first pantry refresh picks up the
+        # result instead of querying again
+        self._pantry_prefetch = self._executor.submit(get_pantry_items)
+
+        # Tabs are only built from here on, so none of them query the
+        # database before it exists
+        self._tab_changed_binding = self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+        self.set_status("Ready")
+
+    def _on_close(self):
+        """
+        Close the window without waiting on background work.
+
+        Jobs that haven't started are dropped; a running export is left to
+        finish writing its file before the process exits.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab the first time it is shown."""
+        tab_id = self.notebook.select()
+        builder = self._tab_builders.pop(tab_id, None)
+        if builder:
+            builder(self.notebook.nametowidget(tab_id))
+
+        # Once every tab exists there is nothing left to do on tab switches
+        if not self._tab_builders and self._tab_changed_binding:
+            self.notebook.unbind("<<NotebookTabChanged>>", self._tab_changed_binding)
+            self._tab_changed_binding = None
+
+    def _get_recipes(self, meal_type: Optional[str]) -> List[Recipe]:
+        """Get recipes for a meal-type filter (None for all), reusing earlier fetches."""
+        if not self._recipe_cache:
+            # One query for every recipe, already sorted by name, bucketed by
+            # meal type so switching filters never goes back to the database
+            recipes = get_all_recipes()
+            self._recipe_cache[None] = recipes
+            for type_name in MEAL_TYPES:
+                self._recipe_cache[type_name] = []
+            for recipe in recipes:
+                self._recipe_cache.setdefault(recipe.meal_type, []).append(recipe)
+        return self._recipe_cache[meal_type]
+
+    def _invalidate_grocery_cache(self):
+        """Drop cached grocery lists after the plan, pantry or recipes change."""
+        self._grocery_cache.clear()
+        self._grocery_generation += 1
+
+    def _fetch_grocery_items(self, deduct_pantry: bool, on_success, on_error, button=None):
+        """
+        Get the grocery list for the current plan, from the cache or a worker.
+
+        Args:
+            deduct_pantry: Whether pantry stock is subtracted
+            on_success: Called on the Tk thread with the list of GroceryItem
+                objects, or None if there is no meal plan
+            on_error: Called with the exception if generation failed
+            button: Optional button to disable while generating
+        """
+        if deduct_pantry in self._grocery_cache:
+            on_success(self._grocery_cache[deduct_pantry])
+            return
+
+        generation = self._grocery_generation
+
+        def work():
+            plan = get_current_plan()
+            if not plan:
+                return None
+            return generate_grocery_list(plan, deduct_pantry=deduct_pantry)
+
+        def on_done(items):
+            # Only cache if nothing changed while the worker was running
+            if items is not None and generation == self._grocery_generation:
+                self._grocery_cache[deduct_pantry] = items
+            on_success(items)
+
+        self._run_in_background(work, on_done, on_error, button=button)
+
+    def _run_in_background(self, func, on_success, on_error, button=None):
+        """
+        Run func on a worker thread and deliver its outcome on the Tk thread.
+
+        Args:
+            func: Callable taking no arguments; must not touch any widgets
+            on_success: Called with func's return value
+            on_error: Called with the exception func raised
+            button: Optional button to disable while func is running
+        """
+        if button is not None:
+            button.state(['disabled'])
+        future = self._executor.submit(func)
+        self.root.after(50, self._poll_future, future, on_success, on_error, button)
+
+    def _poll_future(self, future, on_success, on_error, button):
+        """Check a background future, rescheduling until it completes."""
+        if not future.done():
+            self.root.after(50, self._poll_future, future, on_success, on_error, button)
+            return
+
+        if button is not None:
+            button.state(['!disabled'])
+
+        try:
+            result = future.result()
+        except Exception as e:
+            on_error(e)
+        else:
+            on_success(result)
+
+    def _render_text(self, widget, text: str):
+        """
+        Show text in a Text widget, re-laying out only what changed.
+
+        Skips the update entirely when the text is unchanged, and appends just
+        the new tail when the previous text is a prefix of it. Falls back to a
+        full replace if the user has edited the widget since the last render.
+        Long text is written _TEXT_CHUNK_LINES lines at a time, the first chunk
+        immediately and the rest from idle callbacks, so the first screen shows
+        without waiting for Tk to lay out the whole buffer.
+        """
+        previous = self._rendered_text.get(widget)
+
+        # A render still being written leaves the widget incomplete; stop it
+        # and rewrite from scratch
+        pending = self._render_jobs.pop(widget, None)
+        if pending:
+            self.root.after_cancel(pending)
+            previous = None
+
+        edited = widget.edit_modified()
+        if not edited and text == previous:
+            return
+
+        if not edited and previous and text.startswith(previous):
+            tail = text[len(previous):]
+        else:
+            self._edit_text(widget, widget.delete, 1.0, tk.END)
+            tail = text
+
+        self._rendered_text[widget] = text
+        lines = tail.splitlines(keepends=True)
+        chunks = [''.join(lines[i:i + _TEXT_CHUNK_LINES])
+                  for i in range(0, len(lines), _TEXT_CHUNK_LINES)]
+        self._append_text_chunks(widget, chunks, 0)
+
+    def _append_text_chunks(self, widget, chunks: List[str], index: int):
+        """Append chunks[index] to a Text widget, queueing the next chunk if any."""
+        if index < len(chunks):
+            self._edit_text(widget, widget.insert, 'end-1c', chunks[index])
+
+        if index + 1 < len(chunks):
+            self._render_jobs[widget] = self.root.after_idle(
+                self._append_text_chunks, widget, chunks, index + 1)
+        else:
+            self._render_jobs.pop(widget, None)
+
+    @staticmethod
+    def _edit_text(widget, method, *args):
+        """Apply a Text edit, unlocking read-only (disabled) widgets just for the call."""
+        read_only = str(widget.cget('state')) == tk.DISABLED
+        if read_only:
+            widget.configure(state=tk.NORMAL)
+        method(*args)
+        if read_only:
+            widget.configure(state=tk.DISABLED)
+        widget.edit_modified(False)
+
+    def _notify(self, message: str, *args):
+        """
+        Report a success in the status bar.
+
+        Unlike a pop-up this never blocks the Tk loop waiting for OK, so
+        queued list patches keep coalescing. The message is a str.format
+        template and clears itself after _NOTIFY_CLEAR_MS.
+        """
+        text = message.format(*args) if args else message
+        self.set_status(text)
+        if self._notify_clear_id is not None:
+            self.root.after_cancel(self._notify_clear_id)
+        self._notify_clear_id = self.root.after(_NOTIFY_CLEAR_MS, self._clear_notification, text)
+
+    def _clear_notification(self, text: str):
+        """Reset the status bar, unless it has moved on from this message."""
+        self._notify_clear_id = None
+        if self.status_bar.cget('text') == text:
+            self.set_status("Ready")
+
+    def set_status(self, message: str, flush: bool = False):
+        """
+        Update status bar message.
+
+        Args:
+            message: Text to show
+            flush: Repaint immediately; only needed before blocking the Tk
+                thread, otherwise the event loop repaints on its own. At most
+                one flush runs per _STATUS_FLUSH_INTERVAL seconds
+        """
         self.status_bar.config(text=message)
-        self.root.update_idletasks()
+        if flush:
+            now = time.monotonic()
+            if now - self._last_status_flush >= _STATUS_FLUSH_INTERVAL:
+                self._last_status_flush = now
+                self.root.update_idletasks()
 
     # ==================== Recipes Tab ====================
 
-    def create_recipes_tab(self):
+    def create_recipes_tab(self, tab):
         """Create the recipes management tab."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Recipes")
 
         # Left panel - Recipe list
         left_frame = ttk.Frame(tab)
@@ -189,35 +536,49 @@ class MealPlannerGUI:
         filter_frame.pack(fill=tk.X, pady=8)
 
         ttk.Label(filter_frame, text="Filter by Meal Type:", font=('Arial', 10)).pack(side=tk.LEFT, padx=5)
-        self.recipe_filter = ttk.Combobox(filter_frame, values=["All", "breakfast", "lunch", "dinner", "snack"], state='readonly')
-        self.recipe_filter.set("All")
+        self.recipe_filter_var = tk.StringVar(value="All")
+        self.recipe_filter = ttk.Combobox(filter_frame, textvariable=self.recipe_filter_var,
+                                          values=["All", "breakfast", "lunch", "dinner", "snack"], state='readonly')
         self.recipe_filter.pack(side=tk.LEFT, padx=5)
-        self.recipe_filter.bind("<<ComboboxSelected>>", lambda e: self.refresh_recipes())
+        self._refresh_after_id = None
+        self._shown_recipe_filter = None  # Filter value the list currently reflects
+        self.recipe_filter_var.trace_add('write', lambda *args: self._schedule_refresh_recipes())
 
-        # Recipe listbox
+        # Recipe list - one row per recipe, keyed by recipe name
         list_frame = ttk.Frame(left_frame)
         list_frame.pack(fill=tk.BOTH, expand=True)
 
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.recipe_listbox = tk.Listbox(
+        self.recipe_tree = ttk.Treeview(
             list_frame,
-            yscrollcommand=scrollbar.set,
-            font=('Arial', 11),
-            bg=self.COLORS['bg_medium'],
-            fg=self.COLORS['fg_primary'],
-            selectbackground=self.COLORS['selected'],
-            selectforeground=self.COLORS['fg_primary'],
-            borderwidth=0,
-            highlightthickness=1,
-            highlightbackground=self.COLORS['border'],
-            highlightcolor=self.COLORS['border']
+            columns=('meal', 'time'),
+            show='tree headings',
+            selectmode='browse',
+            yscrollcommand=self._on_recipe_scroll
         )
-        self.recipe_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.recipe_listbox.yview)
-
-        self.recipe_listbox.bind("<<ListboxSelect>>", self.on_recipe_select)
+        self._recipe_scrollbar = scrollbar
+        self.recipe_tree.heading('#0', text="Recipe", anchor=tk.W)
+        self.recipe_tree.heading('meal', text="Meal", anchor=tk.W)
+        self.recipe_tree.heading('time', text="Time", anchor=tk.W)
+        self.recipe_tree.column('#0', width=220, stretch=True)
+        self.recipe_tree.column('meal', width=90, stretch=False)
+        self.recipe_tree.column('time', width=70, stretch=False)
+        self.recipe_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.recipe_tree.yview)
+
+        self.recipe_tree.bind("<<TreeviewSelect>>", self.on_recipe_select)
+
+        # Recipe list the tree rows were built from, and the rows' recipes by
+        # item id. Rows are only created as they are about to scroll into
+        # view: _recipe_view is the filtered list and the first
+        # _recipe_rows_shown of it are attached to the tree
+        self._recipe_rows_source = None
+        self._recipe_index = {}
+        self._recipe_view = []
+        self._recipe_rows_shown = 0
+        self._recipe_extend_id = None
 
         # Buttons
         btn_frame = ttk.Frame(left_frame)
@@ -225,7 +586,8 @@ class MealPlannerGUI:
 
         ttk.Button(btn_frame, text="➕ Add New Recipe", command=self.add_recipe_dialog).pack(side=tk.LEFT, padx=3)
         ttk.Button(btn_frame, text="🗑 Delete Recipe", command=self.delete_recipe).pack(side=tk.LEFT, padx=3)
-        ttk.Button(btn_frame, text="📄 Export to PDF", command=self.export_recipes_pdf).pack(side=tk.LEFT, padx=3)
+        self.export_pdf_btn = ttk.Button(btn_frame, text="📄 Export to PDF", command=self.export_recipes_pdf)
+        self.export_pdf_btn.pack(side=tk.LEFT, padx=3)
 
         # Right panel - Recipe details
         right_frame = ttk.Frame(tab)
@@ -235,88 +597,130 @@ class MealPlannerGUI:
 
         self.recipe_details = scrolledtext.ScrolledText(
             right_frame,
-            wrap=tk.WORD,
             width=50,
             height=30,
-            font=('Arial', 11),
-            bg=self.COLORS['bg_medium'],
-            fg=self.COLORS['fg_primary'],
-            insertbackground=self.COLORS['fg_primary'],
-            selectbackground=self.COLORS['selected'],
-            selectforeground=self.COLORS['fg_primary'],
-            borderwidth=0,
-            highlightthickness=1,
-            highlightbackground=self.COLORS['border'],
-            highlightcolor=self.COLORS['border']
+            **_SCROLLED_TEXT_KWARGS
         )
         self.recipe_details.pack(fill=tk.BOTH, expand=True)
 
         self.refresh_recipes()
 
+    def _schedule_refresh_recipes(self):
+        """Refresh the recipe list shortly, coalescing rapid filter changes."""
+        if self._refresh_after_id:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+        # Re-selecting the filter already shown (or arrowing back to it
+        # before the timer fires) needs no refresh at all
+        if self.recipe_filter_var.get() == self._shown_recipe_filter:
+            return
+        self._refresh_after_id = self.root.after(150, self.refresh_recipes)
+
     def refresh_recipes(self):
         """Refresh the recipe list."""
-        self.recipe_listbox.delete(0, tk.END)
+        # Drop any pending debounced refresh; this one supersedes it
+        if self._refresh_after_id:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
 
         filter_val = self.recipe_filter.get()
         meal_type = None if filter_val == "All" else filter_val
-
-        recipes = get_all_recipes(meal_type=meal_type)
-
-        for recipe in sorted(recipes, key=lambda r: r.name):
-            display_text = f"{recipe.name} ({recipe.meal_type}) - {recipe.total_time()}min"
-            self.recipe_listbox.insert(tk.END, display_text)
+        self._shown_recipe_filter = filter_val
+
+        # Rows are kept until the recipes themselves change. They use the
+        # recipe name as their item id, so selection maps straight back to
+        # the Recipe through _recipe_index
+        all_recipes = self._get_recipes(None)
+        if self._recipe_rows_source is not all_recipes:
+            self.recipe_tree.delete(*self._recipe_index)
+            self._recipe_index = {}
+            self._recipe_rows_source = all_recipes
+
+        self._recipe_view = self._get_recipes(meal_type)
+        self._recipe_rows_shown = 0
+        self._show_recipe_rows(_RECIPE_ROW_BATCH)
+
+    def _show_recipe_rows(self, count: int):
+        """Attach the first count rows of the current recipe view, creating any that don't exist yet."""
+        shown = self._recipe_view[:count]
+        for recipe in shown[self._recipe_rows_shown:]:
+            if recipe.name not in self._recipe_index:
+                self.recipe_tree.insert('', tk.END, iid=recipe.name, text=recipe.name,
+                                        values=(recipe.meal_type, f"{recipe.total_time()}min"))
+                self._recipe_index[recipe.name] = recipe
+
+        # Re-link the rows in one Tcl call; rows left out are detached, not deleted
+        self.recipe_tree.set_children('', *(recipe.name for recipe in shown))
+        self._recipe_rows_shown = len(shown)
+
+    def _on_recipe_scroll(self, first: str, last: str):
+        """Update the scrollbar, attaching another batch of rows near the bottom."""
+        self._recipe_scrollbar.set(first, last)
+        if (float(last) > 0.9 and self._recipe_rows_shown < len(self._recipe_view)
+                and not self._recipe_extend_id):
+            self._recipe_extend_id = self.root.after_idle(self._extend_recipe_rows)
+
+    def _extend_recipe_rows(self):
+        """Attach the next batch of recipe rows."""
+        self._recipe_extend_id = None
+        self._show_recipe_rows(self._recipe_rows_shown + _RECIPE_ROW_BATCH)
 
     def on_recipe_select(self, event):
         """Handle recipe selection."""
-        selection = self.recipe_listbox.curselection()
+        selection = self.recipe_tree.selection()
         if not selection:
             return
 
-        selected_text = self.recipe_listbox.get(selection[0])
-        recipe_name = selected_text.split(" (")[0]
-
-        recipe = get_recipe(recipe_name)
-        if recipe:
-            self.display_recipe_details(recipe)
+        self.display_recipe_details(self._recipe_index[selection[0]])
 
     def display_recipe_details(self, recipe: Recipe):
         """Display recipe details in the text area."""
-        self.recipe_details.delete(1.0, tk.END)
-
-        details = f"{recipe.name}\n"
-        details += "=" * 50 + "\n\n"
-        details += f"Meal Type: {recipe.meal_type.capitalize()}\n"
-        details += f"Servings: {recipe.servings}\n"
-        details += f"Prep Time: {recipe.prep_time} min\n"
-        details += f"Cook Time: {recipe.cook_time} min\n"
-        details += f"Total Time: {recipe.total_time()} min\n"
+        parts = [
+            f"{recipe.name}\n",
+            "=" * 50 + "\n\n",
+            f"Meal Type: {recipe.meal_type.capitalize()}\n",
+            f"Servings: {recipe.servings}\n",
+            f"Prep Time: {recipe.prep_time} min\n",
+            f"Cook Time: {recipe.cook_time} min\n",
+            f"Total Time: {recipe.total_time()} min\n",
+        ]
 
         if recipe.cuisine:
-            details += f"Cuisine: {recipe.cuisine}\n"
+            parts.append(f"Cuisine: {recipe.cuisine}\n")
 
         if recipe.dietary_tags:
-            details += f"Tags: {', '.join(recipe.dietary_tags)}\n"
+            parts.append(f"Tags: {', '.join(recipe.dietary_tags)}\n")
 
-        details += "\nIngredients:\n"
-        details += "-" * 30 + "\n"
+        parts.append("\nIngredients:\n")
+        parts.append("-" * 30 + "\n")
         for ing in recipe.ingredients:
             qty = format_quantity(ing.quantity)
             prep = f", {ing.preparation}" if ing.preparation else ""
-            details += f"  • {qty} {ing.unit} {ing.ingredient_name}{prep}\n"
+            parts.append(f"  • {qty} {ing.unit} {ing.ingredient_name}{prep}\n")
 
         if recipe.instructions:
-            details += "\nInstructions:\n"
-            details += "-" * 30 + "\n"
-            details += recipe.instructions
+            parts.append("\nInstructions:\n")
+            parts.append("-" * 30 + "\n")
+            parts.append(recipe.instructions)
 
-        self.recipe_details.insert(1.0, details)
+        self._render_text(self.recipe_details, ''.join(parts))
 
     def add_recipe_dialog(self):
         """Open dialog to add a new recipe."""
+        # Reuse the hidden dialog from an earlier open, with a blank form
+        if self._add_recipe_dialog is not None:
+            self._reset_add_recipe_form()
+            self._add_recipe_dialog.deiconify()
+            self._add_recipe_dialog.lift()
+            return
+
         dialog = tk.Toplevel(self.root)
         dialog.title("Add Recipe")
         dialog.geometry("600x700")
         dialog.configure(bg=self.COLORS['bg_dark'])
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        self._add_recipe_dialog = dialog
 
         # Create scrollable frame
         canvas = tk.Canvas(
@@ -327,10 +731,35 @@ class MealPlannerGUI:
         scrollbar = ttk.Scrollbar(dialog, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Recompute the scroll region once layout settles, not on every resize event
+        scroll_after = None
+
+        def update_scrollregion(event):
+            nonlocal scroll_after
+            if scroll_after:
+                dialog.after_cancel(scroll_after)
+            scroll_after = dialog.after(50, lambda: canvas.configure(scrollregion=canvas.bbox("all")))
+
+        scrollable_frame.bind("<Configure>", update_scrollregion)
+
+        # Mouse-wheel scrolling while the pointer is over the dialog. Bound
+        # once for the lifetime of the (reused) dialog rather than re-bound on
+        # every <Enter>, which registered a fresh Tcl command each time
+        dialog_path = str(dialog)
+
+        def on_mousewheel(event):
+            widget_path = str(event.widget)
+            if widget_path != dialog_path and not widget_path.startswith(dialog_path + "."):
+                return
+            if event.num == 4:
+                canvas.yview_scroll(-1, "units")
+            elif event.num == 5:
+                canvas.yview_scroll(1, "units")
+            else:
+                canvas.yview_scroll(-int(event.delta / 120), "units")
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind_all(sequence, on_mousewheel, add="+")
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -390,13 +819,7 @@ class MealPlannerGUI:
             scrollable_frame,
             width=50,
             height=10,
-            bg=self.COLORS['bg_medium'],
-            fg=self.COLORS['fg_primary'],
-            insertbackground=self.COLORS['fg_primary'],
-            selectbackground=self.COLORS['selected'],
-            selectforeground=self.COLORS['fg_primary'],
-            borderwidth=1,
-            highlightthickness=0
+            **_INPUT_TEXT_KWARGS
         )
         ingredients_text.grid(row=row, column=0, columnspan=2, padx=5, pady=5)
 
@@ -410,13 +833,7 @@ class MealPlannerGUI:
             scrollable_frame,
             width=50,
             height=10,
-            bg=self.COLORS['bg_medium'],
-            fg=self.COLORS['fg_primary'],
-            insertbackground=self.COLORS['fg_primary'],
-            selectbackground=self.COLORS['selected'],
-            selectforeground=self.COLORS['fg_primary'],
-            borderwidth=1,
-            highlightthickness=0
+            **_INPUT_TEXT_KWARGS
         )
         instructions_text.grid(row=row, column=0, columnspan=2, padx=5, pady=5)
 
@@ -442,33 +859,29 @@ class MealPlannerGUI:
                 tags_str = tags_entry.get().strip()
                 dietary_tags = [t.strip() for t in tags_str.split(",")] if tags_str else []
 
-                # Parse ingredients
+                # Parse ingredients, collecting every bad line before reporting
                 ingredients = []
-                ing_lines = ingredients_text.get(1.0, tk.END).strip().split('\n')
-
-                for line in ing_lines:
-                    line = line.strip()
-                    if not line:
-                        continue
+                errors = []
+                ing_lines = ingredients_text.get(1.0, tk.END).split('\n')
 
+                for line in filter(None, map(str.strip, ing_lines)):
                     try:
                         quantity, unit, ing_name = parse_ingredient_string(line)
+                    except ValueError as e:
+                        errors.append(f"'{line}': {e}")
+                        continue
+
+                    ing_name, _, preparation = ing_name.partition(",")
+                    ingredients.append(RecipeIngredient(
+                        ingredient_name=ing_name.strip(),
+                        quantity=quantity,
+                        unit=unit,
+                        preparation=preparation.strip()
+                    ))
 
-                        preparation = ""
-                        if "," in ing_name:
-                            parts = ing_name.split(",", 1)
-                            ing_name = parts[0].strip()
-                            preparation = parts[1].strip()
-
-                        ingredients.append(RecipeIngredient(
-                            ingredient_name=ing_name,
-                            quantity=quantity,
-                            unit=unit,
-                            preparation=preparation
-                        ))
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Could not parse ingredient '{line}': {e}")
-                        return
+                if errors:
+                    messagebox.showerror("Error", "Could not parse ingredients:\n" + "\n".join(errors))
+                    return
 
                 if not ingredients:
                     messagebox.showerror("Error", "At least one ingredient is required")
@@ -490,13 +903,14 @@ class MealPlannerGUI:
                 )
 
                 recipe_id = add_recipe(recipe)
+                self._recipe_cache.clear()
                 messagebox.showinfo("Success", f"Recipe '{name}' added successfully!")
                 self.refresh_recipes()
-                dialog.destroy()
+                dialog.withdraw()
 
             except ValueError as e:
                 messagebox.showerror("Error", str(e))
-            except Exception as e:
+            except (tk.TclError, sqlite3.DatabaseError) as e:
                 messagebox.showerror("Error", f"Failed to save recipe: {e}")
 
         row += 1
@@ -504,25 +918,40 @@ class MealPlannerGUI:
         btn_frame.grid(row=row, column=0, columnspan=2, pady=20)
 
         ttk.Button(btn_frame, text="Save Recipe", command=save_recipe).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+        def reset_form():
+            for entry in (name_entry, cuisine_entry, tags_entry):
+                entry.delete(0, tk.END)
+            for entry, default in ((servings_entry, "4"), (prep_entry, "0"), (cook_entry, "0")):
+                entry.delete(0, tk.END)
+                entry.insert(0, default)
+            meal_type_var.set("")
+            ingredients_text.delete(1.0, tk.END)
+            instructions_text.delete(1.0, tk.END)
+            canvas.yview_moveto(0)
+            name_entry.focus_set()
+
+        self._reset_add_recipe_form = reset_form
+
     def delete_recipe(self):
         """Delete selected recipe."""
-        selection = self.recipe_listbox.curselection()
+        selection = self.recipe_tree.selection()
         if not selection:
             messagebox.showwarning("Warning", "Please select a recipe to delete")
             return
 
-        selected_text = self.recipe_listbox.get(selection[0])
-        recipe_name = selected_text.split(" (")[0]
+        recipe_name = selection[0]
 
         if messagebox.askyesno("Confirm Delete", f"Delete recipe '{recipe_name}'?"):
             if delete_recipe(recipe_name):
+                self._recipe_cache.clear()
+                self._invalidate_grocery_cache()
                 self.refresh_recipes()
-                self.recipe_details.delete(1.0, tk.END)
+                self._render_text(self.recipe_details, "")
                 messagebox.showinfo("Success", "Recipe deleted")
             else:
                 messagebox.showerror("Error", "Failed to delete recipe")
@@ -534,7 +963,7 @@ class MealPlannerGUI:
         meal_type = None if filter_val == "All" else filter_val
 
         # Get recipes to export
-        recipes = get_all_recipes(meal_type=meal_type)
+        recipes = self._get_recipes(meal_type)
 
         if not recipes:
             messagebox.showwarning("Warning", "No recipes to export")
@@ -544,26 +973,32 @@ class MealPlannerGUI:
         filename = filedialog.asksaveasfilename(
             title="Save recipes as PDF",
             defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+            filetypes=self._PDF_FILETYPES
         )
 
         if filename:
-            try:
-                export_recipes_to_pdf(recipes, filename)
+            def on_success(result):
+                self.set_status(f"Exported {len(recipes)} recipes to PDF")
                 messagebox.showinfo("Success", f"Exported {len(recipes)} recipes to PDF:\n{filename}")
-            except ImportError as e:
-                messagebox.showerror("Error",
-                    "PDF export requires the 'reportlab' library.\n\n"
-                    "Please install it with:\npip install reportlab")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed: {e}")
+
+            def on_error(e):
+                if isinstance(e, ImportError):
+                    messagebox.showerror("Error",
+                                         "PDF export requires the 'reportlab' library.\n\n"
+                                         "Please install it with:\npip install reportlab")
+                else:
+                    messagebox.showerror("Error", f"Export failed: {e}")
+
+            self.set_status("Exporting recipes to PDF...")
+            self._run_in_background(
+                lambda: export_recipes_to_pdf(recipes, filename),
+                on_success, on_error, button=self.export_pdf_btn
+            )
 
     # ==================== Meal Plan Tab ====================
 
-    def create_meal_plan_tab(self):
+    def create_meal_plan_tab(self, tab):
         """Create the meal planning tab."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Meal Plan")
 
         # Top controls
         control_frame = ttk.Frame(tab)
@@ -579,37 +1014,29 @@ class MealPlannerGUI:
         self.servings_spin.set(2)
         self.servings_spin.pack(side=tk.LEFT, padx=5)
 
-        self.breakfast_var = tk.BooleanVar(value=True)
-        self.lunch_var = tk.BooleanVar(value=True)
-        self.dinner_var = tk.BooleanVar(value=True)
-
         ttk.Label(control_frame, text="Include:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=8)
-        ttk.Checkbutton(control_frame, text="🍳 Breakfast", variable=self.breakfast_var).pack(side=tk.LEFT, padx=5)
-        ttk.Checkbutton(control_frame, text="🥗 Lunch", variable=self.lunch_var).pack(side=tk.LEFT, padx=5)
-        ttk.Checkbutton(control_frame, text="🍽 Dinner", variable=self.dinner_var).pack(side=tk.LEFT, padx=5)
 
-        ttk.Button(control_frame, text="✨ Generate Meal Plan", command=self.generate_plan).pack(side=tk.LEFT, padx=15)
+        # One checkbox per plannable meal type, keyed by meal type
+        self.meal_vars = {}
+        for meal_type, label in (('breakfast', "🍳 Breakfast"), ('lunch', "🥗 Lunch"), ('dinner', "🍽 Dinner")):
+            var = self.meal_vars[meal_type] = tk.BooleanVar(value=True)
+            ttk.Checkbutton(control_frame, text=label, variable=var).pack(side=tk.LEFT, padx=5)
+
+        self.generate_plan_btn = ttk.Button(control_frame, text="✨ Generate Meal Plan", command=self.generate_plan)
+        self.generate_plan_btn.pack(side=tk.LEFT, padx=15)
         ttk.Button(control_frame, text="🗑 Clear Plan", command=self.clear_plan).pack(side=tk.LEFT, padx=5)
 
         # Meal plan display
         plan_frame = ttk.Frame(tab)
         plan_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+        # Read-only output; _render_text unlocks it just while writing
         self.plan_text = scrolledtext.ScrolledText(
             plan_frame,
-            wrap=tk.WORD,
             width=80,
             height=25,
-            font=('Arial', 11),
-            bg=self.COLORS['bg_medium'],
-            fg=self.COLORS['fg_primary'],
-            insertbackground=self.COLORS['fg_primary'],
-            selectbackground=self.COLORS['selected'],
-            selectforeground=self.COLORS['fg_primary'],
-            borderwidth=0,
-            highlightthickness=1,
-            highlightbackground=self.COLORS['border'],
-            highlightcolor=self.COLORS['border']
+            state=tk.DISABLED,
+            **_SCROLLED_TEXT_KWARGS
         )
         self.plan_text.pack(fill=tk.BOTH, expand=True)
 
@@ -621,80 +1048,87 @@ class MealPlannerGUI:
             days = int(self.days_spin.get())
             servings = int(self.servings_spin.get())
 
-            meals = []
-            if self.breakfast_var.get():
-                meals.append('breakfast')
-            if self.lunch_var.get():
-                meals.append('lunch')
-            if self.dinner_var.get():
-                meals.append('dinner')
+            meals = [meal_type for meal_type, var in self.meal_vars.items() if var.get()]
 
             if not meals:
                 messagebox.showwarning("Warning", "Select at least one meal type")
                 return
 
-            self.set_status("Generating meal plan...")
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        def work():
             plan = generate_meal_plan(days=days, meals=meals, servings=servings)
             save_meal_plan(plan)
+            return plan
 
-            self.refresh_meal_plan()
+        def on_success(plan):
+            self._invalidate_grocery_cache()
+            self.refresh_meal_plan(plan)
             self.set_status("Meal plan generated successfully")
             messagebox.showinfo("Success", "Meal plan generated!")
 
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate plan: {e}")
+        def on_error(e):
+            self.set_status("Ready")
+            if isinstance(e, ValueError):
+                messagebox.showerror("Error", str(e))
+            else:
+                messagebox.showerror("Error", f"Failed to generate plan: {e}")
+
+        self.set_status("Generating meal plan...")
+        self._run_in_background(work, on_success, on_error, button=self.generate_plan_btn)
 
-    def refresh_meal_plan(self):
-        """Refresh the meal plan display."""
-        self.plan_text.delete(1.0, tk.END)
+    def refresh_meal_plan(self, plan: Optional[MealPlan] = None):
+        """
+        Refresh the meal plan display.
 
-        plan = get_current_plan()
+        Args:
+            plan: Plan to show; loaded from the database if not given
+        """
+        if plan is None:
+            plan = get_current_plan()
 
         if not plan:
-            self.plan_text.insert(1.0, "No meal plan found.\n\nGenerate a plan using the controls above.")
+            self._render_text(self.plan_text, "No meal plan found.\n\nGenerate a plan using the controls above.")
             return
 
-        output = f"Meal Plan ({plan.days} days)\n"
-        output += "=" * 60 + "\n\n"
+        parts = [f"Meal Plan ({plan.days} days)\n", "=" * 60 + "\n\n"]
 
-        meal_icons = {
-            'breakfast': '🍳',
-            'lunch': '🥗',
-            'dinner': '🍽️',
-            'snack': '🍪'
-        }
+        # Place each meal into a fixed day x meal-type slot in one pass, so
+        # days come out grouped and ordered without filtering or sorting
+        slots = [[None] * len(MEAL_TYPES) for _ in range(plan.days)]
+        for meal in plan.meals:
+            slots[meal.day_number - 1][MEAL_TYPES[meal.meal_type]] = meal
 
-        for day in range(1, plan.days + 1):
-            meals = plan.get_meals_for_day(day)
+        for day_slots in slots:
+            meals = [meal for meal in day_slots if meal]
             if not meals:
                 continue
 
-            day_name = meals[0].day_name() if meals else f"Day {day}"
-            output += f"\n{day_name}\n"
-            output += "-" * 40 + "\n"
+            day_name = meals[0].day_name()
+            parts.append(f"\n{day_name}\n")
+            parts.append("-" * 40 + "\n")
 
-            for meal in sorted(meals, key=lambda m: ['breakfast', 'lunch', 'dinner', 'snack'].index(m.meal_type)):
-                icon = meal_icons.get(meal.meal_type, '•')
-                output += f"  {icon} {meal.meal_type.capitalize()}: {meal.recipe.name}\n"
-                output += f"     ({meal.recipe.total_time()} min, {meal.servings} servings)\n"
+            for meal in meals:
+                icon = _MEAL_ICONS.get(meal.meal_type, '•')
+                parts.append(f"  {icon} {meal.meal_type.capitalize()}: {meal.recipe.name}\n")
+                parts.append(f"     ({meal.recipe.total_time()} min, {meal.servings} servings)\n")
 
-        self.plan_text.insert(1.0, output)
+        self._render_text(self.plan_text, ''.join(parts))
 
     def clear_plan(self):
         """Clear the current meal plan."""
         if messagebox.askyesno("Confirm", "Clear current meal plan?"):
             clear_meal_plan()
+            self._invalidate_grocery_cache()
             self.refresh_meal_plan()
             messagebox.showinfo("Success", "Meal plan cleared")
 
     # ==================== Grocery Tab ====================
 
-    def create_grocery_tab(self):
+    def create_grocery_tab(self, tab):
         """Create the grocery list tab."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Grocery List")
 
         # Controls
         control_frame = ttk.Frame(tab)
@@ -702,73 +1136,74 @@ class MealPlannerGUI:
 
         self.deduct_pantry_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(control_frame, text="✓ Deduct items already in pantry",
-                       variable=self.deduct_pantry_var).pack(side=tk.LEFT, padx=8)
+                        variable=self.deduct_pantry_var).pack(side=tk.LEFT, padx=8)
 
-        ttk.Button(control_frame, text="🛒 Generate Shopping List", command=self.generate_grocery_list).pack(side=tk.LEFT, padx=15)
+        self.generate_grocery_btn = ttk.Button(control_frame, text="🛒 Generate Shopping List",
+                                               command=self.generate_grocery_list)
+        self.generate_grocery_btn.pack(side=tk.LEFT, padx=15)
 
         # Export section
         ttk.Label(control_frame, text="Export as:", font=('Arial', 9, 'bold')).pack(side=tk.LEFT, padx=8)
-        ttk.Button(control_frame, text="📄 Text", command=lambda: self.export_grocery('txt')).pack(side=tk.LEFT, padx=2)
-        ttk.Button(control_frame, text="📝 Markdown", command=lambda: self.export_grocery('md')).pack(side=tk.LEFT, padx=2)
-        ttk.Button(control_frame, text="📋 JSON", command=lambda: self.export_grocery('json')).pack(side=tk.LEFT, padx=2)
+        ttk.Button(control_frame, text="📄 Text",
+                   command=lambda: self.export_grocery('txt')).pack(side=tk.LEFT, padx=2)
+        ttk.Button(control_frame, text="📝 Markdown",
+                   command=lambda: self.export_grocery('md')).pack(side=tk.LEFT, padx=2)
+        ttk.Button(control_frame, text="📋 JSON",
+                   command=lambda: self.export_grocery('json')).pack(side=tk.LEFT, padx=2)
 
         # Grocery list display
         list_frame = ttk.Frame(tab)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+        # Read-only output; _render_text unlocks it just while writing
         self.grocery_text = scrolledtext.ScrolledText(
             list_frame,
-            wrap=tk.WORD,
             width=80,
             height=25,
-            font=('Arial', 11),
-            bg=self.COLORS['bg_medium'],
-            fg=self.COLORS['fg_primary'],
-            insertbackground=self.COLORS['fg_primary'],
-            selectbackground=self.COLORS['selected'],
-            selectforeground=self.COLORS['fg_primary'],
-            borderwidth=0,
-            highlightthickness=1,
-            highlightbackground=self.COLORS['border'],
-            highlightcolor=self.COLORS['border']
+            state=tk.DISABLED,
+            **_SCROLLED_TEXT_KWARGS
         )
         self.grocery_text.pack(fill=tk.BOTH, expand=True)
 
     def generate_grocery_list(self):
         """Generate grocery list from current meal plan."""
-        try:
-            plan = get_current_plan()
+        def on_error(e):
+            self.set_status("Ready")
+            messagebox.showerror("Error", f"Failed to generate grocery list: {e}")
 
-            if not plan:
+        self.set_status("Generating grocery list...")
+        self._fetch_grocery_items(self.deduct_pantry_var.get(), self._show_grocery_list, on_error,
+                                  button=self.generate_grocery_btn)
+
+    def _show_grocery_list(self, items):
+        """Render a generated grocery list (None means there is no plan)."""
+        try:
+            if items is None:
+                self.set_status("Ready")
                 messagebox.showwarning("Warning", "No meal plan found. Generate a meal plan first.")
                 return
 
-            self.set_status("Generating grocery list...")
-            deduct_pantry = self.deduct_pantry_var.get()
-            items = generate_grocery_list(plan, deduct_pantry=deduct_pantry)
-
             if not items:
-                self.grocery_text.delete(1.0, tk.END)
-                self.grocery_text.insert(1.0, "No items needed - pantry covers everything!")
+                self._render_text(self.grocery_text, "No items needed - pantry covers everything!")
                 self.set_status("Grocery list is empty")
                 return
 
             # Display list
-            output = f"Grocery List ({len(items)} items)\n"
-            output += "=" * 60 + "\n\n"
+            parts = [f"Grocery List ({len(items)} items)\n", "=" * 60 + "\n\n"]
+
+            # Format every quantity in one pass ahead of the layout loop
+            quantities = [format_quantity(item.quantity) for item in items]
 
             current_category = None
-            for item in items:
+            for item, qty in zip(items, quantities):
                 if item.category != current_category:
                     current_category = item.category
-                    output += f"\n{current_category}\n"
-                    output += "-" * 40 + "\n"
+                    parts.append(f"\n{current_category}\n")
+                    parts.append("-" * 40 + "\n")
 
-                qty = format_quantity(item.quantity)
-                output += f"  [ ] {item.ingredient_name} - {qty} {item.unit}\n"
+                parts.append(f"  [ ] {item.ingredient_name} - {qty} {item.unit}\n")
 
-            self.grocery_text.delete(1.0, tk.END)
-            self.grocery_text.insert(1.0, output)
+            self._render_text(self.grocery_text, ''.join(parts))
             self.set_status(f"Grocery list generated ({len(items)} items)")
 
         except Exception as e:
@@ -776,61 +1211,72 @@ class MealPlannerGUI:
 
     def export_grocery(self, format_type: str):
         """Export grocery list to file."""
-        try:
-            plan = get_current_plan()
-            if not plan:
+        def on_items(items):
+            if items is None:
+                self.set_status("Ready")
                 messagebox.showwarning("Warning", "No meal plan found")
                 return
 
-            deduct_pantry = self.deduct_pantry_var.get()
-            items = generate_grocery_list(plan, deduct_pantry=deduct_pantry)
-
             if not items:
+                self.set_status("Ready")
                 messagebox.showwarning("Warning", "No items to export")
                 return
 
-            extensions = {'txt': '.txt', 'md': '.md', 'json': '.json'}
             filename = filedialog.asksaveasfilename(
                 title="Save grocery list",
-                defaultextension=extensions[format_type],
-                filetypes=[(f"{format_type.upper()} files", f"*{extensions[format_type]}"), ("All files", "*.*")]
+                defaultextension=self._EXPORT_EXTS[format_type],
+                filetypes=self._EXPORT_FILETYPES[format_type]
             )
 
             if filename:
-                output_path = export_grocery_list(items, format=format_type, output_path=filename)
-                messagebox.showinfo("Success", f"Exported to {output_path}")
+                self.set_status("Exporting grocery list...")
+                self._run_in_background(
+                    lambda: export_grocery_list(items, format=format_type, output_path=filename),
+                    on_exported, on_error
+                )
+            else:
+                self.set_status("Ready")
 
-        except Exception as e:
+        def on_exported(output_path):
+            self._notify("Exported grocery list to {}", output_path)
+
+        def on_error(e):
+            self.set_status("Ready")
             messagebox.showerror("Error", f"Export failed: {e}")
 
+        self.set_status("Preparing grocery list...")
+        self._fetch_grocery_items(self.deduct_pantry_var.get(), on_items, on_error)
+
     # ==================== Pantry Tab ====================
 
-    def create_pantry_tab(self):
+    def create_pantry_tab(self, tab):
         """Create the pantry management tab."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Pantry")
 
         # Left panel - Add/Update
         left_frame = ttk.LabelFrame(tab, text="➕ Add or Update Item", padding=10)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        ttk.Label(left_frame, text="Ingredient Name:", font=('Arial', 10)).grid(row=0, column=0, sticky=tk.W, padx=5, pady=8)
-        self.pantry_ingredient = ttk.Entry(left_frame, width=30)
-        self.pantry_ingredient.grid(row=0, column=1, padx=5, pady=5)
-
-        ttk.Label(left_frame, text="Quantity:", font=('Arial', 10)).grid(row=1, column=0, sticky=tk.W, padx=5, pady=8)
-        self.pantry_quantity = ttk.Entry(left_frame, width=15)
-        self.pantry_quantity.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-
-        ttk.Label(left_frame, text="Unit (e.g., cups, lbs):", font=('Arial', 10)).grid(row=2, column=0, sticky=tk.W, padx=5, pady=8)
-        self.pantry_unit = ttk.Entry(left_frame, width=15)
-        self.pantry_unit.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        # Keystrokes that could never form a number are rejected as typed
+        validate_qty = (self.root.register(self._is_partial_quantity), '%P')
+        fields = (
+            ("Ingredient Name:", dict(width=30), ''),
+            ("Quantity:", dict(width=15, validate='key', validatecommand=validate_qty), tk.W),
+            ("Unit (e.g., cups, lbs):", dict(width=15), tk.W),
+        )
+        entries = []
+        for row, (label, entry_options, sticky) in enumerate(fields):
+            ttk.Label(left_frame, text=label, font=('Arial', 10)).grid(row=row, column=0, sticky=tk.W, padx=5, pady=8)
+            entry = ttk.Entry(left_frame, **entry_options)
+            entry.grid(row=row, column=1, sticky=sticky, padx=5, pady=5)
+            entries.append(entry)
+        self.pantry_ingredient, self.pantry_quantity, self.pantry_unit = entries
 
         btn_frame = ttk.Frame(left_frame)
         btn_frame.grid(row=3, column=0, columnspan=2, pady=15)
 
         ttk.Button(btn_frame, text="➕ Add to Pantry", command=self.add_pantry).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="🔄 Update Quantity", command=self.update_pantry).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="📋 Bulk Add...", command=self.bulk_add_pantry_dialog).pack(side=tk.LEFT, padx=5)
 
         # Right panel - Pantry list
         right_frame = ttk.Frame(tab)
@@ -844,28 +1290,66 @@ class MealPlannerGUI:
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.pantry_listbox = tk.Listbox(
+        # Category nodes are inserted up front; their item rows are only
+        # created when a category is first expanded
+        self.pantry_tree = ttk.Treeview(
             list_frame,
-            yscrollcommand=scrollbar.set,
-            font=('Arial', 11),
-            width=50,
-            bg=self.COLORS['bg_medium'],
-            fg=self.COLORS['fg_primary'],
-            selectbackground=self.COLORS['selected'],
-            selectforeground=self.COLORS['fg_primary'],
-            borderwidth=0,
-            highlightthickness=1,
-            highlightbackground=self.COLORS['border'],
-            highlightcolor=self.COLORS['border']
+            columns=('qty', 'unit'),
+            show='tree headings',
+            selectmode='browse',
+            yscrollcommand=scrollbar.set
         )
-        self.pantry_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.pantry_listbox.yview)
+        self.pantry_tree.heading('#0', text="Item", anchor=tk.W)
+        self.pantry_tree.heading('qty', text="Quantity", anchor=tk.W)
+        self.pantry_tree.heading('unit', text="Unit", anchor=tk.W)
+        self.pantry_tree.column('#0', width=220, stretch=True)
+        self.pantry_tree.column('qty', width=80, stretch=False)
+        self.pantry_tree.column('unit', width=80, stretch=False)
+        self.pantry_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.pantry_tree.yview)
+
+        self._pantry_unfilled = set()  # category nodes holding only a placeholder child
+        self._pantry_row_ingredients = {}  # item row iid -> ingredient name
+        # Sorted category -> items index of what is on display, and the same
+        # as (pantry id, name, quantity, unit, row values) tuples for comparing
+        # against a reload; the row values carry the formatted quantity, so
+        # filling or re-filling a category never formats it again
+        self._pantry_index = {}
+        self._pantry_model = None
+        self._open_pantry_categories = set()
+        self.pantry_tree.bind("<<TreeviewOpen>>", self._on_pantry_open)
+        self.pantry_tree.bind("<<TreeviewClose>>", self._on_pantry_close)
 
         ttk.Button(right_frame, text="🗑 Remove Selected Item", command=self.remove_pantry).pack(pady=5)
+        # Changes made here patch the list in place; a full reload is only
+        # needed to pick up changes made elsewhere, such as from the CLI
         ttk.Button(right_frame, text="🔄 Refresh List", command=self.refresh_pantry).pack(pady=5)
 
+        # Ingredients changed since the last patch, applied together at idle
+        self._pantry_dirty = set()
+        self._pantry_flush_pending = False
         self.refresh_pantry()
 
+    def _is_partial_quantity(self, proposed: str) -> bool:
+        """Tk validatecommand: accept an edit only if it may become a quantity."""
+        return self._QTY_PARTIAL_RE.fullmatch(proposed) is not None
+
+    def _get_pantry_quantity(self) -> Optional[float]:
+        """
+        Read the pantry quantity entry.
+
+        The text is checked against a pattern before it is converted, so a
+        typo is reported without raising and catching a ValueError.
+
+        Returns:
+            The quantity, or None (after telling the user) if it is not a number
+        """
+        text = self.pantry_quantity.get().strip()
+        if not self._QTY_RE.fullmatch(text):
+            messagebox.showerror("Error", "Invalid quantity")
+            return None
+        return float(text)
+
     def add_pantry(self):
         """Add item to pantry."""
         try:
@@ -874,7 +1358,9 @@ class MealPlannerGUI:
                 messagebox.showwarning("Warning", "Enter ingredient name")
                 return
 
-            quantity = float(self.pantry_quantity.get())
+            quantity = self._get_pantry_quantity()
+            if quantity is None:
+                return
             unit = self.pantry_unit.get().strip()
 
             if not unit:
@@ -888,20 +1374,92 @@ class MealPlannerGUI:
             )
 
             add_pantry_item(item)
-            messagebox.showinfo("Success", f"Added {quantity} {unit} of {ingredient}")
+            self._patch_pantry_ingredient(ingredient)
+            self._notify("Added {} {} of {}", quantity, unit, ingredient)
 
             # Clear inputs
             self.pantry_ingredient.delete(0, tk.END)
             self.pantry_quantity.delete(0, tk.END)
             self.pantry_unit.delete(0, tk.END)
 
-            self.refresh_pantry()
-
-        except ValueError as e:
-            messagebox.showerror("Error", "Invalid quantity")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add item: {e}")
 
+    def bulk_add_pantry_dialog(self):
+        """Open a dialog for adding many pantry items at once, one per line."""
+        # Reuse the hidden dialog from an earlier open
+        if self._bulk_pantry_dialog is not None:
+            self._bulk_pantry_dialog.deiconify()
+            self._bulk_pantry_dialog.lift()
+            self._bulk_pantry_text.focus_set()
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Bulk Add to Pantry")
+        dialog.geometry("450x400")
+        dialog.configure(bg=self.COLORS['bg_dark'])
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        self._bulk_pantry_dialog = dialog
+
+        ttk.Label(dialog, text="Items (one per line):",
+                  font=('Arial', 10, 'bold')).pack(anchor=tk.W, padx=10, pady=(10, 0))
+        ttk.Label(dialog, text="Format: '2 cups flour' or '1 lb chicken'").pack(anchor=tk.W, padx=10)
+
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(side=tk.BOTTOM, pady=10)
+        ttk.Button(btn_frame, text="➕ Add All", command=self.bulk_add_pantry).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+
+        self._bulk_pantry_text = scrolledtext.ScrolledText(dialog, width=50, height=15, **_INPUT_TEXT_KWARGS)
+        self._bulk_pantry_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self._bulk_pantry_text.focus_set()
+
+    def bulk_add_pantry(self):
+        """
+        Add every line of the Bulk Add dialog to the pantry.
+
+        All items are written in one transaction and the pantry list is
+        patched once afterwards, instead of one write and redraw per item.
+        """
+        # Parse every line, collecting every bad one before reporting
+        items = []
+        errors = []
+        lines = self._bulk_pantry_text.get(1.0, tk.END).split('\n')
+
+        for line in filter(None, map(str.strip, lines)):
+            try:
+                quantity, unit, ingredient = parse_ingredient_string(line)
+            except ValueError as e:
+                errors.append(f"'{line}': {e}")
+                continue
+
+            items.append(PantryItem(
+                ingredient_name=ingredient.partition(",")[0].strip(),
+                quantity=quantity,
+                unit=unit
+            ))
+
+        if errors:
+            messagebox.showerror("Error", "Could not parse items:\n" + "\n".join(errors))
+            return
+
+        if not items:
+            messagebox.showwarning("Warning", "Enter at least one item")
+            return
+
+        try:
+            add_pantry_items_bulk(items)
+        except (ValueError, sqlite3.DatabaseError) as e:
+            messagebox.showerror("Error", f"Failed to add items: {e}")
+            return
+
+        for item in items:
+            self._patch_pantry_ingredient(item.ingredient_name)
+        self._notify("Added {} items to pantry", len(items))
+
+        self._bulk_pantry_text.delete(1.0, tk.END)
+        self._bulk_pantry_dialog.withdraw()
+
     def update_pantry(self):
         """Update pantry item quantity."""
         try:
@@ -910,7 +1468,9 @@ class MealPlannerGUI:
                 messagebox.showwarning("Warning", "Enter ingredient name")
                 return
 
-            quantity = float(self.pantry_quantity.get())
+            quantity = self._get_pantry_quantity()
+            if quantity is None:
+                return
             unit = self.pantry_unit.get().strip()
 
             if not unit:
@@ -918,67 +1478,189 @@ class MealPlannerGUI:
                 return
 
             if update_pantry_quantity(ingredient, quantity, unit):
-                messagebox.showinfo("Success", f"Updated {ingredient} to {quantity} {unit}")
-                self.refresh_pantry()
+                self._patch_pantry_ingredient(ingredient)
+                self._notify("Updated {} to {} {}", ingredient, quantity, unit)
             else:
                 messagebox.showerror("Error", "Item not found in pantry")
 
-        except ValueError:
-            messagebox.showerror("Error", "Invalid quantity")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update: {e}")
 
     def remove_pantry(self):
         """Remove selected pantry item."""
-        selection = self.pantry_listbox.curselection()
-        if not selection:
+        selection = self.pantry_tree.selection()
+        ingredient = self._pantry_row_ingredients.get(selection[0]) if selection else None
+        if ingredient is None:
             messagebox.showwarning("Warning", "Select an item to remove")
             return
 
-        selected_text = self.pantry_listbox.get(selection[0])
-        ingredient = selected_text.split(":")[0].strip()
-
         if messagebox.askyesno("Confirm", f"Remove '{ingredient}' from pantry?"):
             if remove_pantry_item(ingredient):
-                self.refresh_pantry()
-                messagebox.showinfo("Success", "Item removed")
+                self._patch_pantry_ingredient(ingredient)
+                self._notify("Removed {} from pantry", ingredient)
             else:
                 messagebox.showerror("Error", "Failed to remove item")
 
-    def refresh_pantry(self):
-        """Refresh pantry list."""
-        self.pantry_listbox.delete(0, tk.END)
+    def _patch_pantry_ingredient(self, ingredient: str):
+        """
+        Update the pantry list after one ingredient changed.
+
+        The change is queued and applied with any others made before the Tk
+        loop next goes idle, so a burst of updates costs a single redraw.
+        """
+        self._pantry_dirty.add(normalize_ingredient_name(ingredient))
+        if not self._pantry_flush_pending:
+            self._pantry_flush_pending = True
+            self.root.after_idle(self._flush_pantry_patches)
+
+    def _flush_pantry_patches(self):
+        """
+        Apply queued ingredient changes to the pantry list.
+
+        Re-reads just those ingredients' entries and swaps them into their
+        categories, so only those categories' rows are rebuilt.
+        """
+        self._pantry_flush_pending = False
+        dirty, self._pantry_dirty = self._pantry_dirty, set()
+        if not dirty:
+            return
 
-        items = get_pantry_items()
+        index = dict(self._pantry_index)
+        for name in dirty:
+            category = get_ingredient_category(name)
+            # Rows are kept sorted by name, so the ingredient's entries are one
+            # contiguous run, found by bisection and replaced without a re-sort
+            rows = list(index.get(category, ()))
+            names = list(map(_INGREDIENT_NAME, rows))
+            rows[bisect_left(names, name):bisect_right(names, name)] = get_pantry_items(ingredient_name=name)
+            if rows:
+                index[category] = rows
+            else:
+                index.pop(category, None)
 
-        if not items:
-            self.pantry_listbox.insert(tk.END, "Pantry is empty")
-            return
+        self._show_pantry(dict(sorted(index.items())))
 
-        # Group by category
-        by_category = {}
-        for item in items:
-            category = get_ingredient_category(item.ingredient_name)
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(item)
+    def refresh_pantry(self):
+        """Reload the pantry list from the database."""
+        # A full reload covers any queued patches
+        self._pantry_dirty.clear()
+
+        items = None
+        prefetch, self._pantry_prefetch = self._pantry_prefetch, None
+        if prefetch:
+            try:
+                items = prefetch.result()
+            except sqlite3.Error:
+                pass  # Retried below on this thread
+        if items is None:
+            items = get_pantry_items()
+
+        self._show_pantry(_group_pantry_items(items))
+
+    def _show_pantry(self, index: dict):
+        """
+        Bring the pantry tree in line with a sorted category -> items index.
+
+        The whole display model is built in Python first, and the tree is left
+        alone when it already shows exactly these rows.
+        """
+        model = {category: [(item.id, item.ingredient_name, item.quantity, item.unit,
+                             (format_quantity(item.quantity), item.unit))
+                            for item in rows]
+                 for category, rows in index.items()}
+        if model == self._pantry_model:
+            return
+        if self._pantry_model is not None:
+            # Cached grocery lists deduct pantry stock, so any change to it,
+            # whether made here or picked up by a reload, makes them stale
+            self._invalidate_grocery_cache()
+        previous = self._pantry_model or {}
+        self._pantry_index = index
+        self._pantry_model = model
+
+        # Tk already repaints once, at idle, after the rebuild; what the user
+        # would see is the list jumping to the top and losing its selection,
+        # so both are carried over to the new rows
+        first_visible = self.pantry_tree.yview()[0]
+        selection = self.pantry_tree.selection()
+
+        # Only categories whose items changed are rebuilt. Their nodes are
+        # reused, with just the count and children replaced, and the new
+        # order is applied in one call. An empty pantry goes through the same
+        # path, with a placeholder node as its only top-level row
+        nodes = []
+        if not index:
+            if not self.pantry_tree.exists(self._PANTRY_EMPTY):
+                self.pantry_tree.insert('', tk.END, iid=self._PANTRY_EMPTY, text="Pantry is empty")
+            nodes.append(self._PANTRY_EMPTY)
+        for category, rows in index.items():
+            node = f"category:{category}"
+            nodes.append(node)
+            if self.pantry_tree.exists(node):
+                if previous.get(category) == model[category]:
+                    continue
+                self.pantry_tree.item(node, text=f"{category} ({len(rows)})")
+                self._clear_pantry_category(node)
+            else:
+                self.pantry_tree.insert('', tk.END, iid=node, text=f"{category} ({len(rows)})",
+                                        open=node in self._open_pantry_categories)
 
-        for category in sorted(by_category.keys()):
-            self.pantry_listbox.insert(tk.END, f"\n--- {category} ---")
-            for item in sorted(by_category[category], key=lambda x: x.ingredient_name):
-                qty = format_quantity(item.quantity)
-                self.pantry_listbox.insert(tk.END, f"  {item.ingredient_name}: {qty} {item.unit}")
+            # Categories the user left expanded are filled now; the rest get a
+            # placeholder child so they can be expanded, and fill on first open
+            if node in self._open_pantry_categories:
+                self._fill_pantry_category(node, model[category])
+            else:
+                self.pantry_tree.insert(node, tk.END)
+                self._pantry_unfilled.add(node)
+
+        stale = set(self.pantry_tree.get_children()).difference(nodes)
+        for node in stale:
+            self._clear_pantry_category(node)
+        if stale:
+            self.pantry_tree.delete(*stale)
+        self.pantry_tree.set_children('', *nodes)
+
+        self.pantry_tree.yview_moveto(first_visible)
+        # Item rows are keyed by pantry id, so a rebuilt row has the same iid
+        if selection and not self.pantry_tree.selection() and self.pantry_tree.exists(selection[0]):
+            self.pantry_tree.selection_set(selection[0])
+
+    def _clear_pantry_category(self, node: str):
+        """Delete the rows under a pantry category node and forget them."""
+        children = self.pantry_tree.get_children(node)
+        for row in children:
+            self._pantry_row_ingredients.pop(row, None)
+        self._pantry_unfilled.discard(node)
+        self.pantry_tree.delete(*children)
+
+    def _fill_pantry_category(self, node: str, rows: List[tuple]):
+        """Insert the item rows under a pantry category node from its display model."""
+        for pantry_id, name, _, _, values in rows:
+            row = self.pantry_tree.insert(node, tk.END, iid=f"pantry:{pantry_id}", text=name, values=values)
+            self._pantry_row_ingredients[row] = name
+
+    def _on_pantry_open(self, event):
+        """Populate a pantry category the first time it is expanded."""
+        node = self.pantry_tree.focus()
+        self._open_pantry_categories.add(node)
+
+        if node in self._pantry_unfilled:
+            self._pantry_unfilled.discard(node)
+            self.pantry_tree.delete(*self.pantry_tree.get_children(node))
+            self._fill_pantry_category(node, self._pantry_model[node.partition(':')[2]])
+
+    def _on_pantry_close(self, event):
+        """Forget that a pantry category was expanded."""
+        self._open_pantry_categories.discard(self.pantry_tree.focus())
 
     # ==================== Help & Info Tab ====================
 
-    def create_help_tab(self):
+    def create_help_tab(self, tab):
         """Create the help and information tab."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="ℹ️ Help & Info")
-
-        # Content
+        # Content, read-only
         content = scrolledtext.ScrolledText(
             tab,
+            state=tk.DISABLED,
             wrap=tk.WORD,
             font=('Arial', 11),
             bg=self.COLORS['bg_medium'],
@@ -991,253 +1673,7 @@ class MealPlannerGUI:
         )
         content.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
 
-        # Help text content
-        help_text = """👨‍🍳 MEAL PLANNER & GROCERY LIST GENERATOR - USER GUIDE
-
-═══════════════════════════════════════════════════════════════════════
-
-📖 WHAT THIS APP DOES
-
-This application helps you:
-  ✓ Store and organize your favorite recipes
-  ✓ Generate weekly meal plans automatically
-  ✓ Create shopping lists based on your meal plan
-  ✓ Track your pantry inventory
-  ✓ Export recipes to PDF for easy sharing and printing
-  ✓ Organize recipes by meal type (breakfast, lunch, dinner, snack)
-  ✓ Filter recipes by dietary preferences
-
-
-═══════════════════════════════════════════════════════════════════════
-
-📚 RECIPES TAB - How to Use
-
-ADD NEW RECIPES:
-  1. Click "➕ Add New Recipe" button
-  2. Fill in recipe details (name, meal type, servings, etc.)
-  3. Add ingredients one per line (e.g., "2 cups flour" or "1 lb chicken, diced")
-  4. Add cooking instructions
-  5. Click "Save Recipe"
-
-VIEW RECIPE DETAILS:
-  • Click on any recipe in the list to see full details
-  • Use the filter dropdown to show only specific meal types
-
-DELETE RECIPES:
-  1. Select a recipe from the list
-  2. Click "🗑 Delete Recipe"
-  3. Confirm deletion
-
-EXPORT RECIPES TO PDF:
-  • Click "📄 Export to PDF" to save recipes as a PDF file
-  • The export will include all recipes shown in the current filter
-  • PDFs are perfect for printing or sharing with friends!
-
-
-═══════════════════════════════════════════════════════════════════════
-
-📅 MEAL PLAN TAB - How to Use
-
-GENERATE A MEAL PLAN:
-  1. Set the number of days (1-14 days)
-  2. Set servings per meal
-  3. Check which meals to include (Breakfast, Lunch, Dinner)
-  4. Click "✨ Generate Meal Plan"
-
-The app will:
-  • Randomly select recipes from your collection
-  • Create a balanced meal plan with variety
-  • Show total cooking time for each meal
-  • Display all meals organized by day
-
-CLEAR MEAL PLAN:
-  • Click "🗑 Clear Plan" to start over
-
-
-═══════════════════════════════════════════════════════════════════════
-
-🛒 GROCERY LIST TAB - How to Use
-
-GENERATE SHOPPING LIST:
-  1. First, create a meal plan in the Meal Plan tab
-  2. Go to Grocery List tab
-  3. Check "✓ Deduct items already in pantry" if you want to subtract pantry items
-  4. Click "🛒 Generate Shopping List"
-
-The app will:
-  • Combine all ingredients from your meal plan
-  • Group items by category (Produce, Dairy, Meat, etc.)
-  • Show quantities needed for each item
-  • Subtract items you already have in your pantry (if checked)
-
-EXPORT GROCERY LIST:
-  • 📄 Text - Plain text file for printing
-  • 📝 Markdown - Formatted markdown file
-  • 📋 JSON - Structured data file
-
-
-═══════════════════════════════════════════════════════════════════════
-
-🏺 PANTRY TAB - How to Use
-
-ADD ITEMS TO PANTRY:
-  1. Enter ingredient name
-  2. Enter quantity
-  3. Enter unit (cups, lbs, oz, etc.)
-  4. Click "➕ Add to Pantry"
-
-UPDATE QUANTITIES:
-  • Use the same form to update existing items
-  • Click "🔄 Update Quantity"
-
-REMOVE ITEMS:
-  1. Select an item from the list
-  2. Click "🗑 Remove Selected Item"
-
-WHY USE PANTRY?
-  • Track what you already have
-  • Avoid buying duplicate items
-  • Reduce food waste
-  • Save money on groceries
-
-
-═══════════════════════════════════════════════════════════════════════
-
-✅ WHAT THIS APP HAS
-
-  ✓ 8 Pre-loaded everyday recipes (breakfast, lunch, dinner, snacks)
-  ✓ Beautiful cream-themed interface
-  ✓ Recipe management (add, view, delete, export)
-  ✓ Automatic meal planning for up to 14 days
-  ✓ Smart grocery list generation
-  ✓ Pantry inventory tracking
-  ✓ PDF export for recipes
-  ✓ Multiple export formats for grocery lists
-  ✓ Recipe filtering by meal type
-  ✓ Dietary tags support (vegetarian, vegan, etc.)
-  ✓ Ingredient categorization
-  ✓ Local database storage (all data saved on your computer)
-
-
-═══════════════════════════════════════════════════════════════════════
-
-❌ WHAT THIS APP DOES NOT HAVE
-
-  ✗ Internet/cloud sync - All data is stored locally on your computer
-  ✗ Recipe sharing between users - PDF export only
-  ✗ Nutrition calculations - No calorie or macro tracking
-  ✗ Recipe import from websites - Manual entry only
-  ✗ Mobile app - Desktop application only
-  ✗ Barcode scanning for pantry items
-  ✗ Price tracking or budget features
-  ✗ Integration with online grocery stores
-  ✗ Recipe rating or reviews
-  ✗ Cooking timers or reminders
-  ✗ Photo uploads for recipes
-  ✗ Meal prep scheduling
-  ✗ PDF import for recipes (PDF export only)
-
-
-═══════════════════════════════════════════════════════════════════════
-
-💡 TIPS & BEST PRACTICES
-
-RECIPE TIPS:
-  • Be specific with ingredient quantities and units
-  • Include preparation notes (e.g., "diced", "chopped", "sliced")
-  • Write clear, numbered instructions
-  • Add dietary tags to make filtering easier
-
-MEAL PLANNING TIPS:
-  • Start with 7 days for a weekly plan
-  • Add more recipes to get more variety in meal plans
-  • Adjust servings based on household size
-  • Review your pantry before generating grocery lists
-
-PANTRY TIPS:
-  • Keep pantry updated for accurate grocery lists
-  • Use consistent units (don't mix cups and ounces for same item)
-  • Remove expired items regularly
-  • Add common staples (flour, sugar, oil, etc.)
-
-GROCERY LIST TIPS:
-  • Always generate a new list after changing your meal plan
-  • Check pantry items before shopping
-  • Export to Text format for easy printing
-  • Export to Markdown for digital note-taking apps
-
-
-═══════════════════════════════════════════════════════════════════════
-
-🔧 TECHNICAL INFORMATION
-
-DATA STORAGE:
-  • All recipes, meal plans, and pantry items are stored in a local SQLite database
-  • Database location: data/meal_planner.db (in application folder)
-  • Your data is private and never leaves your computer
-
-REQUIREMENTS:
-  • Python 3.7 or higher
-  • reportlab library (for PDF export)
-  • SQLite (included with Python)
-
-BACKUP YOUR DATA:
-  • Copy the entire "data" folder to backup your recipes
-  • Export recipes to PDF for additional backup
-
-
-═══════════════════════════════════════════════════════════════════════
-
-❓ FREQUENTLY ASKED QUESTIONS
-
-Q: Why can't I import recipes from PDF files?
-A: PDF is designed for viewing, not for importing structured data. You can only export
-   to PDF. To add recipes, use the "➕ Add New Recipe" button.
-
-Q: Can I share my recipes with friends?
-A: Yes! Export your recipes to PDF and share the PDF file. Recipients can read the
-   recipes but will need to manually add them to their own app.
-
-Q: How do I backup my recipes?
-A: Copy the "data" folder from the application directory, or export all recipes to
-   PDF for a readable backup.
-
-Q: Can I use this app on multiple computers?
-A: The app doesn't sync automatically. You can copy the "data" folder to move your
-   recipes between computers.
-
-Q: Why isn't my grocery list showing all ingredients?
-A: Make sure you've generated a meal plan first. The grocery list is based on your
-   current meal plan.
-
-Q: How do I add recipes from websites?
-A: Currently, you need to manually copy and paste recipe information into the
-   "Add New Recipe" form. There's no automatic import feature.
-
-
-═══════════════════════════════════════════════════════════════════════
-
-📞 NEED HELP?
-
-If you encounter any issues or have questions:
-  • Review this Help & Info tab
-  • Check that all required libraries are installed
-  • Verify your database file exists in the data folder
-  • Make sure you have write permissions in the application folder
-
-
-═══════════════════════════════════════════════════════════════════════
-
-🎉 ENJOY YOUR MEAL PLANNING!
-
-This app is designed to make meal planning and grocery shopping easier. Start by
-exploring the 8 pre-loaded recipes, add your own favorites, and generate your first
-meal plan. Happy cooking! 👨‍🍳
-
-"""
-
-        content.insert(1.0, help_text)
-        content.config(state='disabled')  # Make it read-only
+        self._render_text(content, _load_help())
 
 
 def main():
@@ -3,9 +3,11 @@
 
 import argparse
 import sys
+from itertools import groupby
+from operator import attrgetter
 from typing import List
 
-from models import Recipe, RecipeIngredient, PantryItem
+from models import Recipe, RecipeIngredient, PantryItem, MEAL_TYPES
 from database import initialize_database
 from recipe_manager import (
     add_recipe, get_recipe, get_all_recipes, delete_recipe,
@@ -15,12 +17,19 @@ from meal_planner import (
     generate_meal_plan, get_current_plan, save_meal_plan,
     swap_meal, get_swap_suggestions, clear_meal_plan
 )
-from grocery_generator import generate_grocery_list, export_grocery_list, get_grocery_summary
+from grocery_generator import generate_grocery_list, export_grocery_list, get_grocery_summary, EXPORT_FORMATS
 from pantry_manager import (
     add_pantry_item, get_pantry_items, update_pantry_quantity,
     remove_pantry_item, get_pantry_value_by_category
 )
-from utils import parse_quantity
+from utils import parse_quantity, parse_ingredient_string, format_quantity, get_ingredient_category
+
+MEAL_ICONS = {
+    'breakfast': '🍳',
+    'lunch': '🥗',
+    'dinner': '🍽️',
+    'snack': '🍪'
+}
 
 
 def print_header(text: str) -> None:
@@ -66,7 +75,7 @@ def cmd_recipe_add(args) -> None:
 
         print("\nMeal Type Options: breakfast, lunch, dinner, snack")
         meal_type = input("Meal Type: ").strip().lower()
-        if meal_type not in ['breakfast', 'lunch', 'dinner', 'snack']:
+        if meal_type not in MEAL_TYPES:
             print_error(f"Invalid meal type: {meal_type}")
             return
 
@@ -92,7 +101,6 @@ def cmd_recipe_add(args) -> None:
                 break
 
             try:
-                from utils import parse_ingredient_string
                 quantity, unit, ing_name = parse_ingredient_string(ing_input)
 
                 # Check for preparation notes (after comma)
@@ -172,7 +180,7 @@ def cmd_recipe_list(args) -> None:
                 by_type[recipe.meal_type] = []
             by_type[recipe.meal_type].append(recipe)
 
-        for meal_type in ['breakfast', 'lunch', 'dinner', 'snack']:
+        for meal_type in MEAL_TYPES:
             if meal_type in by_type:
                 print_section(meal_type.upper())
                 for recipe in sorted(by_type[meal_type], key=lambda r: r.name):
@@ -208,7 +216,6 @@ def cmd_recipe_view(args) -> None:
 
         print_section("Ingredients")
         for ing in recipe.ingredients:
-            from utils import format_quantity
             qty = format_quantity(ing.quantity)
             prep = f", {ing.preparation}" if ing.preparation else ""
             print(f"  • {qty} {ing.unit} {ing.ingredient_name}{prep}")
@@ -334,23 +341,13 @@ def _display_meal_plan(plan) -> None:
     """Display a meal plan."""
     print_header(f"Meal Plan ({plan.days} days)")
 
-    for day in range(1, plan.days + 1):
-        meals = plan.get_meals_for_day(day)
-        if not meals:
-            continue
-
-        day_name = meals[0].day_name() if meals else f"Day {day}"
-        print_section(day_name)
-
-        meal_icons = {
-            'breakfast': '🍳',
-            'lunch': '🥗',
-            'dinner': '🍽️',
-            'snack': '🍪'
-        }
+    # Plans come ordered by day then meal type, so one pass groups the days
+    for _, day_meals in groupby(plan.meals, key=attrgetter('day_number')):
+        meals = list(day_meals)
+        print_section(meals[0].day_name())
 
-        for meal in sorted(meals, key=lambda m: ['breakfast', 'lunch', 'dinner', 'snack'].index(m.meal_type)):
-            icon = meal_icons.get(meal.meal_type, '•')
+        for meal in meals:
+            icon = MEAL_ICONS.get(meal.meal_type, '•')
             print(f"  {icon} {meal.meal_type.capitalize()}: {meal.recipe.name} ({meal.recipe.total_time()} min, {meal.servings} servings)")
 
 
@@ -487,7 +484,6 @@ def _display_grocery_list(items) -> None:
             current_category = item.category
             print_section(current_category)
 
-        from utils import format_quantity
         qty = format_quantity(item.quantity)
         print(f"  [ ] {item.ingredient_name} - {qty} {item.unit}")
 
@@ -527,19 +523,15 @@ def cmd_pantry_list(args) -> None:
 
         print_header(f"Pantry Inventory ({len(items)} items)")
 
-        # Group by category
-        from utils import get_ingredient_category
+        # Group by category; items arrive sorted by name, so each bucket
+        # is already in order and only the category names need sorting
         by_category = {}
         for item in items:
-            category = get_ingredient_category(item.ingredient_name)
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(item)
+            by_category.setdefault(get_ingredient_category(item.ingredient_name), []).append(item)
 
-        for category in sorted(by_category.keys()):
+        for category in sorted(by_category):
             print_section(category)
-            for item in sorted(by_category[category], key=lambda x: x.ingredient_name):
-                from utils import format_quantity
+            for item in by_category[category]:
                 qty = format_quantity(item.quantity)
                 print(f"  • {item.ingredient_name}: {qty} {item.unit}")
 
@@ -649,7 +641,7 @@ def main():
 
     # grocery export
     gexport_parser = grocery_sub.add_parser("export", help="Export grocery list to file")
-    gexport_parser.add_argument("--format", "-f", choices=["txt", "md", "json"], default="txt", help="Export format")
+    gexport_parser.add_argument("--format", "-f", choices=EXPORT_FORMATS, default="txt", help="Export format")
     gexport_parser.add_argument("--output", "-o", help="Output file path")
     gexport_parser.add_argument("--no-pantry", action="store_true", help="Don't deduct pantry items")
 
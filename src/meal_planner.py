@@ -3,10 +3,15 @@
 import random
 from typing import List, Dict, Optional
 
-from models import Recipe, PlannedMeal, MealPlan
-from database import get_connection
+from models import Recipe, PlannedMeal, MealPlan, MEAL_TYPES
+from database import get_connection, transaction
 from recipe_manager import get_all_recipes, get_recipe
 
+# SQL sort key that orders meal types the same way as MEAL_TYPES
+_MEAL_ORDER_SQL = "CASE meal_type " + " ".join(
+    f"WHEN '{meal_type}' THEN {position}" for meal_type, position in MEAL_TYPES.items()
+) + " END"
+
 
 def generate_meal_plan(
     days: int = 7,
@@ -32,7 +37,7 @@ def generate_meal_plan(
         dietary_tags: Required tags (e.g., ['vegetarian'])
 
     Returns:
-        MealPlan object with planned meals
+        MealPlan object with planned meals, ordered by day then meal type
 
     Raises:
         ValueError: If invalid parameters or not enough recipes
@@ -47,11 +52,13 @@ def generate_meal_plan(
         meals = ['breakfast', 'lunch', 'dinner']
 
     # Validate meal types
-    valid_meals = {'breakfast', 'lunch', 'dinner', 'snack'}
     for meal in meals:
-        if meal not in valid_meals:
+        if meal not in MEAL_TYPES:
             raise ValueError(f"Invalid meal type: {meal}")
 
+    # Plan each day's meals in display order so callers needn't re-sort
+    meals = sorted(meals, key=MEAL_TYPES.__getitem__)
+
     # Get all recipes with filters
     all_recipes = get_all_recipes(dietary_tags=dietary_tags)
 
@@ -107,19 +114,18 @@ def get_current_plan() -> Optional[MealPlan]:
     Get the current meal plan from database.
 
     Returns:
-        MealPlan object or None if no plan exists
+        MealPlan object (meals ordered by day then meal type) or None if no plan exists
     """
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT day_number, meal_type, recipe_id, servings
         FROM current_meal_plan
-        ORDER BY day_number, meal_type
+        ORDER BY day_number, {_MEAL_ORDER_SQL}
     """)
 
     rows = cursor.fetchall()
-    conn.close()
 
     if not rows:
         return None
@@ -135,7 +141,6 @@ def get_current_plan() -> Optional[MealPlan]:
         cursor = get_connection().cursor()
         cursor.execute("SELECT name FROM recipes WHERE id = ?", (recipe_id,))
         recipe_row = cursor.fetchone()
-        cursor.connection.close()
 
         if recipe_row:
             recipe = get_recipe(recipe_row[0])
@@ -157,26 +162,29 @@ def save_meal_plan(plan: MealPlan) -> None:
     Args:
         plan: MealPlan object to save
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    _replace_meal_plan(plan)
 
-    try:
-        # Clear existing plan
-        cursor.execute("DELETE FROM current_meal_plan")
 
-        # Insert new plan
-        for meal in plan.meals:
-            cursor.execute("""
-                INSERT INTO current_meal_plan (day_number, meal_type, recipe_id, servings)
-                VALUES (?, ?, ?, ?)
-            """, (meal.day_number, meal.meal_type, meal.recipe.id, meal.servings))
+@transaction
+def _replace_meal_plan(conn, plan: MealPlan) -> None:
+    """
+    Swap the stored plan for a new one in a single transaction.
 
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
+    Args:
+        conn: Database connection (supplied by @transaction)
+        plan: MealPlan object to save
+    """
+    cursor = conn.cursor()
+
+    # Clear existing plan
+    cursor.execute("DELETE FROM current_meal_plan")
+
+    # Insert new plan
+    for meal in plan.meals:
+        cursor.execute("""
+            INSERT INTO current_meal_plan (day_number, meal_type, recipe_id, servings)
+            VALUES (?, ?, ?, ?)
+        """, (meal.day_number, meal.meal_type, meal.recipe.id, meal.servings))
 
 
 def clear_meal_plan() -> None:
@@ -184,8 +192,6 @@ def clear_meal_plan() -> None:
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("DELETE FROM current_meal_plan")
-    conn.commit()
-    conn.close()
 
 
 def swap_meal(day: int, meal_type: str, new_recipe_name: str) -> bool:
@@ -215,6 +221,10 @@ def swap_meal(day: int, meal_type: str, new_recipe_name: str) -> bool:
     cursor = conn.cursor()
 
     try:
+        # Lock before the existence check so the slot can't change between
+        # the SELECT and the UPDATE
+        cursor.execute("BEGIN IMMEDIATE")
+
         # Check if meal exists in plan
         cursor.execute("""
             SELECT servings FROM current_meal_plan
@@ -223,7 +233,7 @@ def swap_meal(day: int, meal_type: str, new_recipe_name: str) -> bool:
 
         row = cursor.fetchone()
         if not row:
-            conn.close()
+            conn.rollback()
             return False
 
         servings = row[0]
@@ -241,8 +251,6 @@ def swap_meal(day: int, meal_type: str, new_recipe_name: str) -> bool:
     except Exception as e:
         conn.rollback()
         raise e
-    finally:
-        conn.close()
 
 
 def get_swap_suggestions(meal_type: str, exclude: List[str] = None) -> List[Recipe]:
@@ -305,7 +313,5 @@ def update_meal_servings(day: int, meal_type: str, new_servings: int) -> bool:
     """, (new_servings, day, meal_type))
 
     updated = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
 
     return updated
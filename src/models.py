@@ -4,6 +4,10 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+# Valid meal types in display order, mapped to their sort position.
+# Checked in Python before writes so invalid input fails before any SQL runs.
+MEAL_TYPES = {"breakfast": 0, "lunch": 1, "dinner": 2, "snack": 3}
+
 
 @dataclass
 class Ingredient:
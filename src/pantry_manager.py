@@ -1,12 +1,34 @@
 """Pantry inventory management."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from collections import defaultdict
 from datetime import datetime
+import itertools
+import threading
 
 from models import PantryItem
-from database import get_connection
+from database import get_connection, execute_many, transaction
 from utils import normalize_ingredient_name, normalize_unit, can_convert_units, convert_units
-from recipe_manager import _get_or_create_ingredient
+from recipe_manager import _get_or_create_ingredient, _get_or_create_ingredients
+
+# Full pantry reads are reused until the pantry changes. Writes made through
+# this module move _pantry_version; PRAGMA data_version moves whenever any
+# other connection commits, including the CLI running in another process
+_pantry_writes = itertools.count()
+_pantry_version = next(_pantry_writes)
+
+# Last full pantry read as (pantry version, rows), shared by every thread.
+# The rows are immutable; each caller gets its own PantryItems built from them
+_pantry_cache: Optional[Tuple[int, tuple]] = None
+
+# Per thread: its connection and the data_version that connection last reported
+_seen = threading.local()
+
+
+def _pantry_changed() -> None:
+    """Mark cached pantry reads stale after a committed write."""
+    global _pantry_version
+    _pantry_version = next(_pantry_writes)
 
 
 def add_pantry_item(item: PantryItem) -> int:
@@ -28,83 +50,183 @@ def add_pantry_item(item: PantryItem) -> int:
     if item.quantity <= 0:
         raise ValueError("Quantity must be positive")
 
-    normalized_name = normalize_ingredient_name(item.ingredient_name)
-    normalized_unit = normalize_unit(item.unit)
-
     conn = get_connection()
-    cursor = conn.cursor()
 
     try:
-        # Get or create ingredient
-        ingredient_id = _get_or_create_ingredient(conn, normalized_name)
-
-        # Check if item with same ingredient and unit already exists
-        cursor.execute("""
-            SELECT id, quantity
-            FROM pantry
-            WHERE ingredient_id = ? AND unit = ?
-        """, (ingredient_id, normalized_unit))
-
-        existing = cursor.fetchone()
-
-        if existing:
-            # Update existing quantity
-            pantry_id = existing[0]
-            new_quantity = existing[1] + item.quantity
-
-            cursor.execute("""
-                UPDATE pantry
-                SET quantity = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (new_quantity, pantry_id))
-        else:
-            # Insert new pantry item
-            cursor.execute("""
-                INSERT INTO pantry (ingredient_id, quantity, unit)
-                VALUES (?, ?, ?)
-            """, (ingredient_id, item.quantity, normalized_unit))
-            pantry_id = cursor.lastrowid
-
+        conn.execute("BEGIN IMMEDIATE")
+        pantry_id = _upsert_pantry_item(conn, item)
         conn.commit()
+        _pantry_changed()
         return pantry_id
 
     except Exception as e:
         conn.rollback()
         raise e
-    finally:
-        conn.close()
 
 
-def get_pantry_items() -> List[PantryItem]:
+def add_pantry_items_bulk(items: List[PantryItem]) -> List[int]:
     """
-    Get all pantry items.
+    Add or update several pantry items in a single transaction.
+
+    Each item is merged exactly as add_pantry_item would merge it, but the
+    ingredients are resolved and the rows upserted in batches, the whole
+    batch is committed once, and nothing is written if any item fails.
+
+    Args:
+        items: PantryItems to add
 
     Returns:
-        List of PantryItem objects
+        Pantry item IDs, in the order of items
+
+    Raises:
+        ValueError: If any quantity is invalid
     """
-    conn = get_connection()
+    if any(item.quantity <= 0 for item in items):
+        raise ValueError("Quantity must be positive")
+
+    if not items:
+        return []
+
+    pantry_ids = _upsert_pantry_items(items)
+    _pantry_changed()
+    return pantry_ids
+
+
+@transaction
+def _upsert_pantry_items(conn, items: List[PantryItem]) -> List[int]:
+    """Merge a batch of items into the pantry with one upsert per (ingredient, unit)."""
+    ingredient_ids = _get_or_create_ingredients(conn, [item.ingredient_name for item in items])
+    keys = [
+        (ingredient_ids[normalize_ingredient_name(item.ingredient_name)], normalize_unit(item.unit))
+        for item in items
+    ]
+
+    # Repeats within the batch are summed first, as separate adds would be
+    totals = defaultdict(float)
+    for key, item in zip(keys, items):
+        totals[key] += item.quantity
+
+    execute_many("""
+        INSERT INTO pantry (ingredient_id, quantity, unit)
+        VALUES (?, ?, ?)
+        ON CONFLICT(ingredient_id, unit) DO UPDATE
+        SET quantity = quantity + excluded.quantity, updated_at = CURRENT_TIMESTAMP
+    """, [(ingredient_id, quantity, unit) for (ingredient_id, unit), quantity in totals.items()])
+
+    ingredient_list = list({ingredient_id for ingredient_id, _ in totals})
+    placeholders = ','.join('?' * len(ingredient_list))
+    cursor = conn.execute(
+        f"SELECT ingredient_id, unit, id FROM pantry WHERE ingredient_id IN ({placeholders})",
+        ingredient_list
+    )
+    pantry_ids = {(ingredient_id, unit): pantry_id for ingredient_id, unit, pantry_id in cursor}
+    return [pantry_ids[key] for key in keys]
+
+
+def _upsert_pantry_item(conn, item: PantryItem) -> int:
+    """Merge one item into the pantry inside the caller's transaction."""
+    normalized_name = normalize_ingredient_name(item.ingredient_name)
+    normalized_unit = normalize_unit(item.unit)
+
     cursor = conn.cursor()
 
+    # Get or create ingredient
+    ingredient_id = _get_or_create_ingredient(conn, normalized_name)
+
+    # Check if item with same ingredient and unit already exists
     cursor.execute("""
-        SELECT p.id, i.name, p.quantity, p.unit, p.updated_at, i.id
-        FROM pantry p
-        JOIN ingredients i ON p.ingredient_id = i.id
-        ORDER BY i.name
-    """)
+        SELECT id, quantity
+        FROM pantry
+        WHERE ingredient_id = ? AND unit = ?
+    """, (ingredient_id, normalized_unit))
 
-    items = []
-    for row in cursor.fetchall():
-        items.append(PantryItem(
+    existing = cursor.fetchone()
+
+    if existing:
+        # Update existing quantity
+        pantry_id = existing[0]
+        new_quantity = existing[1] + item.quantity
+
+        cursor.execute("""
+            UPDATE pantry
+            SET quantity = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (new_quantity, pantry_id))
+    else:
+        # Insert new pantry item
+        cursor.execute("""
+            INSERT INTO pantry (ingredient_id, quantity, unit)
+            VALUES (?, ?, ?)
+        """, (ingredient_id, item.quantity, normalized_unit))
+        pantry_id = cursor.lastrowid
+
+    return pantry_id
+
+
+def get_pantry_items(ingredient_name: Optional[str] = None) -> List[PantryItem]:
+    """
+    Get all pantry items.
+
+    The full pantry is read from the database only when it has changed
+    since the last full read; otherwise the previous rows are reused. The
+    returned items are always new objects, so callers may modify them.
+
+    Args:
+        ingredient_name: Only return the entries (one per unit) for this ingredient
+
+    Returns:
+        List of PantryItem objects, ordered by ingredient name
+    """
+    conn = get_connection()
+
+    if ingredient_name:
+        cursor = conn.execute("""
+            SELECT p.id, i.name, p.quantity, p.unit, p.updated_at, i.id
+            FROM pantry p
+            JOIN ingredients i ON p.ingredient_id = i.id
+            WHERE i.name = ?
+            ORDER BY i.name
+        """, (normalize_ingredient_name(ingredient_name),))
+        return _pantry_items_from_rows(cursor.fetchall())
+
+    global _pantry_cache
+
+    # data_version can only be compared on one connection, so each thread
+    # checks its own against what it saw last. A thread with no baseline yet
+    # can't rule out an outside change and treats the cache as stale
+    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    if getattr(_seen, 'conn', None) is not conn or _seen.data_version != data_version:
+        _seen.conn, _seen.data_version = conn, data_version
+        _pantry_changed()
+
+    version = _pantry_version
+    cached = _pantry_cache
+    if cached is None or cached[0] != version:
+        cursor = conn.execute("""
+            SELECT p.id, i.name, p.quantity, p.unit, p.updated_at, i.id
+            FROM pantry p
+            JOIN ingredients i ON p.ingredient_id = i.id
+            ORDER BY i.name
+        """)
+        # Tagged with the version from before the read, so a write that lands
+        # during it still makes the next call re-read
+        cached = _pantry_cache = (version, tuple(cursor.fetchall()))
+    return _pantry_items_from_rows(cached[1])
+
+
+def _pantry_items_from_rows(rows) -> List[PantryItem]:
+    """Build PantryItem objects from (id, name, quantity, unit, updated_at, ingredient id) rows."""
+    return [
+        PantryItem(
             id=row[0],
             ingredient_name=row[1],
             quantity=row[2],
             unit=row[3],
             updated_at=row[4],
             ingredient_id=row[5]
-        ))
-
-    conn.close()
-    return items
+        )
+        for row in rows
+    ]
 
 
 def get_pantry_item(ingredient_name: str, unit: Optional[str] = None) -> Optional[PantryItem]:
@@ -140,7 +262,6 @@ def get_pantry_item(ingredient_name: str, unit: Optional[str] = None) -> Optiona
         """, (normalized_name,))
 
     row = cursor.fetchone()
-    conn.close()
 
     if not row:
         return None
@@ -195,8 +316,7 @@ def update_pantry_quantity(ingredient_name: str, quantity: float, unit: str) ->
         """, (quantity, normalized_name, normalized_unit))
 
     updated = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+    _pantry_changed()
 
     return updated
 
@@ -231,8 +351,7 @@ def remove_pantry_item(ingredient_name: str, unit: Optional[str] = None) -> bool
         """, (normalized_name,))
 
     deleted = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+    _pantry_changed()
 
     return deleted
 
@@ -256,6 +375,10 @@ def deduct_from_pantry(ingredient_name: str, quantity: float, unit: str) -> floa
     cursor = conn.cursor()
 
     try:
+        # Read and update under one write lock, so the deduction is based on
+        # quantities nobody else can change meanwhile
+        cursor.execute("BEGIN IMMEDIATE")
+
         # Get all pantry items for this ingredient
         cursor.execute("""
             SELECT id, quantity, unit
@@ -266,7 +389,7 @@ def deduct_from_pantry(ingredient_name: str, quantity: float, unit: str) -> floa
         pantry_items = cursor.fetchall()
 
         if not pantry_items:
-            conn.close()
+            conn.rollback()
             return quantity  # Nothing in pantry, need full amount
 
         remaining_needed = quantity
@@ -313,13 +436,12 @@ def deduct_from_pantry(ingredient_name: str, quantity: float, unit: str) -> floa
                 """, (new_pantry_qty, pantry_id))
 
         conn.commit()
+        _pantry_changed()
         return max(0, remaining_needed)
 
     except Exception as e:
         conn.rollback()
         raise e
-    finally:
-        conn.close()
 
 
 def clear_pantry() -> int:
@@ -334,9 +456,7 @@ def clear_pantry() -> int:
 
     cursor.execute("DELETE FROM pantry")
     count = cursor.rowcount
-
-    conn.commit()
-    conn.close()
+    _pantry_changed()
 
     return count
 
@@ -363,5 +483,4 @@ def get_pantry_value_by_category() -> dict:
     for row in cursor.fetchall():
         results[row[0]] = row[1]
 
-    conn.close()
     return results
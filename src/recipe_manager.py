@@ -1,18 +1,23 @@
 """Recipe CRUD operations."""
 
 import json
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable
 from pathlib import Path
 
-from models import Recipe, RecipeIngredient, Ingredient
-from database import execute_query, execute_command, get_connection
+from models import Recipe, RecipeIngredient, Ingredient, MEAL_TYPES
+from database import get_connection, execute_many, transaction
 from utils import normalize_ingredient_name, get_ingredient_category
 
+# Normalized ingredient name -> ID, filled on lookup (ingredients are never deleted)
+_ingredient_ids: Dict[str, int] = {}
+
 
 def _get_or_create_ingredient(conn, ingredient_name: str) -> int:
     """
     Get ingredient ID or create if it doesn't exist.
 
+    IDs are memoized in _ingredient_ids so repeated lookups skip the query.
+
     Args:
         conn: Database connection
         ingredient_name: Name of the ingredient
@@ -21,7 +26,10 @@ def _get_or_create_ingredient(conn, ingredient_name: str) -> int:
         Ingredient ID
     """
     normalized_name = normalize_ingredient_name(ingredient_name)
-    category = get_ingredient_category(normalized_name)
+
+    ingredient_id = _ingredient_ids.get(normalized_name)
+    if ingredient_id is not None:
+        return ingredient_id
 
     cursor = conn.cursor()
 
@@ -30,17 +38,64 @@ def _get_or_create_ingredient(conn, ingredient_name: str) -> int:
     row = cursor.fetchone()
 
     if row:
+        _ingredient_ids[normalized_name] = row[0]
         return row[0]
 
-    # Create new ingredient
+    # Create new ingredient (part of the caller's transaction, if any)
+    category = get_ingredient_category(normalized_name)
     cursor.execute(
         "INSERT INTO ingredients (name, category) VALUES (?, ?)",
         (normalized_name, category)
     )
-    conn.commit()
+
+    # Only memoize once committed; an open transaction may still roll back
+    if not conn.in_transaction:
+        _ingredient_ids[normalized_name] = cursor.lastrowid
     return cursor.lastrowid
 
 
+def _get_or_create_ingredients(conn, ingredient_names: Iterable[str]) -> Dict[str, int]:
+    """
+    Resolve many ingredient names to IDs, creating missing ones in one batch.
+
+    Uses a constant number of statements regardless of how many names are
+    given. Only pre-existing IDs are memoized, since newly inserted rows may
+    still be rolled back by the caller's transaction.
+
+    Args:
+        conn: Database connection
+        ingredient_names: Ingredient names (normalized internally)
+
+    Returns:
+        Dict mapping normalized ingredient name to ingredient ID
+    """
+    names = {normalize_ingredient_name(name) for name in ingredient_names}
+    ids = {name: _ingredient_ids[name] for name in names if name in _ingredient_ids}
+    missing = [name for name in names if name not in ids]
+
+    if not missing:
+        return ids
+
+    cursor = conn.cursor()
+    placeholders = ','.join('?' * len(missing))
+
+    cursor.execute(f"SELECT id, name FROM ingredients WHERE name IN ({placeholders})", missing)
+    for ingredient_id, name in cursor.fetchall():
+        ids[name] = _ingredient_ids[name] = ingredient_id
+
+    new_names = [name for name in missing if name not in ids]
+    if new_names:
+        execute_many(
+            "INSERT INTO ingredients (name, category) VALUES (?, ?) ON CONFLICT(name) DO NOTHING",
+            [(name, get_ingredient_category(name)) for name in new_names]
+        )
+        placeholders = ','.join('?' * len(new_names))
+        cursor.execute(f"SELECT id, name FROM ingredients WHERE name IN ({placeholders})", new_names)
+        ids.update({name: ingredient_id for ingredient_id, name in cursor.fetchall()})
+
+    return ids
+
+
 def add_recipe(recipe: Recipe) -> int:
     """
     Add a new recipe to the database.
@@ -57,60 +112,78 @@ def add_recipe(recipe: Recipe) -> int:
     if not recipe.name or not recipe.name.strip():
         raise ValueError("Recipe name cannot be empty")
 
+    if recipe.meal_type not in MEAL_TYPES:
+        raise ValueError(f"Invalid meal type: {recipe.meal_type}")
+
     if not recipe.ingredients:
         raise ValueError("Recipe must have at least one ingredient")
 
     if recipe.servings <= 0:
         raise ValueError("Servings must be positive")
 
-    conn = get_connection()
+    return _insert_recipe(recipe)
+
+
+@transaction
+def _insert_recipe(conn, recipe: Recipe) -> int:
+    """
+    Insert a validated recipe with its ingredients and tags.
+
+    The duplicate check runs inside the write transaction, so no other
+    connection can add the same name between the check and the insert.
+
+    Args:
+        conn: Database connection (supplied by @transaction)
+        recipe: Recipe object with all details
+
+    Returns:
+        ID of created recipe
+
+    Raises:
+        ValueError: If recipe name already exists
+    """
     cursor = conn.cursor()
 
-    try:
-        # Check if recipe already exists
-        cursor.execute("SELECT id FROM recipes WHERE LOWER(name) = LOWER(?)", (recipe.name,))
-        if cursor.fetchone():
-            raise ValueError(f"Recipe '{recipe.name}' already exists")
-
-        # Insert recipe
-        cursor.execute("""
-            INSERT INTO recipes (name, meal_type, prep_time, cook_time, servings, cuisine, instructions)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            recipe.name,
-            recipe.meal_type,
-            recipe.prep_time,
-            recipe.cook_time,
-            recipe.servings,
-            recipe.cuisine,
-            recipe.instructions
-        ))
-        recipe_id = cursor.lastrowid
-
-        # Insert ingredients
-        for ing in recipe.ingredients:
-            ingredient_id = _get_or_create_ingredient(conn, ing.ingredient_name)
-
-            cursor.execute("""
-                INSERT INTO recipe_ingredients (recipe_id, ingredient_id, quantity, unit, preparation)
-                VALUES (?, ?, ?, ?, ?)
-            """, (recipe_id, ingredient_id, ing.quantity, ing.unit, ing.preparation))
-
-        # Insert dietary tags
-        for tag in recipe.dietary_tags:
-            cursor.execute("""
-                INSERT INTO dietary_tags (recipe_id, tag)
-                VALUES (?, ?)
-            """, (recipe_id, tag))
-
-        conn.commit()
-        return recipe_id
-
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
+    # Check if recipe already exists
+    cursor.execute("SELECT id FROM recipes WHERE LOWER(name) = LOWER(?)", (recipe.name,))
+    if cursor.fetchone():
+        raise ValueError(f"Recipe '{recipe.name}' already exists")
+
+    # Insert recipe
+    cursor.execute("""
+        INSERT INTO recipes (name, meal_type, prep_time, cook_time, servings, cuisine, instructions)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (
+        recipe.name,
+        recipe.meal_type,
+        recipe.prep_time,
+        recipe.cook_time,
+        recipe.servings,
+        recipe.cuisine,
+        recipe.instructions
+    ))
+    recipe_id = cursor.lastrowid
+
+    # Insert ingredients
+    ingredient_ids = _get_or_create_ingredients(
+        conn, [ing.ingredient_name for ing in recipe.ingredients]
+    )
+    execute_many("""
+        INSERT INTO recipe_ingredients (recipe_id, ingredient_id, quantity, unit, preparation)
+        VALUES (?, ?, ?, ?, ?)
+    """, [
+        (recipe_id, ingredient_ids[normalize_ingredient_name(ing.ingredient_name)],
+         ing.quantity, ing.unit, ing.preparation)
+        for ing in recipe.ingredients
+    ])
+
+    # Insert dietary tags
+    execute_many("""
+        INSERT INTO dietary_tags (recipe_id, tag)
+        VALUES (?, ?)
+    """, [(recipe_id, tag) for tag in recipe.dietary_tags])
+
+    return recipe_id
 
 
 def get_recipe(name: str) -> Optional[Recipe]:
@@ -135,7 +208,6 @@ def get_recipe(name: str) -> Optional[Recipe]:
 
     row = cursor.fetchone()
     if not row:
-        conn.close()
         return None
 
     recipe_id = row[0]
@@ -168,8 +240,6 @@ def get_recipe(name: str) -> Optional[Recipe]:
 
     dietary_tags = [row[0] for row in cursor.fetchall()]
 
-    conn.close()
-
     return Recipe(
         id=row[0],
         name=row[1],
@@ -195,7 +265,7 @@ def get_all_recipes(meal_type: Optional[str] = None, dietary_tags: Optional[List
         dietary_tags: Filter by dietary tags (must have ALL specified tags)
 
     Returns:
-        List of Recipe objects
+        List of Recipe objects, ordered by name (case-insensitive)
     """
     conn = get_connection()
     cursor = conn.cursor()
@@ -218,17 +288,19 @@ def get_all_recipes(meal_type: Optional[str] = None, dietary_tags: Optional[List
         where_clauses.append(f"dt.tag IN ({placeholders})")
         params.extend(dietary_tags)
 
+    if where_clauses:
+        query += " WHERE " + " AND ".join(where_clauses)
+
+    if dietary_tags:
         # Ensure recipe has ALL specified tags
         query += f" GROUP BY r.id HAVING COUNT(DISTINCT dt.tag) = {len(dietary_tags)}"
 
-    if where_clauses:
-        query += " WHERE " + " AND ".join(where_clauses)
+    # Sorted by SQLite via idx_recipes_name rather than in every caller
+    query += " ORDER BY r.name COLLATE NOCASE"
 
     cursor.execute(query, params)
     recipe_names = [row[0] for row in cursor.fetchall()]
 
-    conn.close()
-
     # Get full recipe details for each
     recipes = []
     for name in recipe_names:
@@ -256,73 +328,91 @@ def update_recipe(name: str, updated_recipe: Recipe) -> bool:
     if not updated_recipe.name or not updated_recipe.name.strip():
         raise ValueError("Recipe name cannot be empty")
 
+    if updated_recipe.meal_type not in MEAL_TYPES:
+        raise ValueError(f"Invalid meal type: {updated_recipe.meal_type}")
+
     if not updated_recipe.ingredients:
         raise ValueError("Recipe must have at least one ingredient")
 
-    conn = get_connection()
+    return _update_recipe(name, updated_recipe)
+
+
+@transaction
+def _update_recipe(conn, name: str, updated_recipe: Recipe) -> bool:
+    """
+    Replace a recipe's fields, ingredients and tags with validated new data.
+
+    The existence and conflict checks run inside the write transaction, so
+    nothing can change between them and the update.
+
+    Args:
+        conn: Database connection (supplied by @transaction)
+        name: Current recipe name
+        updated_recipe: Updated recipe data
+
+    Returns:
+        True if updated successfully, False if recipe not found
+
+    Raises:
+        ValueError: If the new name belongs to another recipe
+    """
     cursor = conn.cursor()
 
-    try:
-        # Check if original recipe exists
-        cursor.execute("SELECT id FROM recipes WHERE LOWER(name) = LOWER(?)", (name,))
-        row = cursor.fetchone()
-        if not row:
-            conn.close()
-            return False
-
-        recipe_id = row[0]
-
-        # If name is changing, check for conflicts
-        if name.lower() != updated_recipe.name.lower():
-            cursor.execute("SELECT id FROM recipes WHERE LOWER(name) = LOWER(?)", (updated_recipe.name,))
-            if cursor.fetchone():
-                raise ValueError(f"Recipe '{updated_recipe.name}' already exists")
-
-        # Update recipe
-        cursor.execute("""
-            UPDATE recipes
-            SET name = ?, meal_type = ?, prep_time = ?, cook_time = ?,
-                servings = ?, cuisine = ?, instructions = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (
-            updated_recipe.name,
-            updated_recipe.meal_type,
-            updated_recipe.prep_time,
-            updated_recipe.cook_time,
-            updated_recipe.servings,
-            updated_recipe.cuisine,
-            updated_recipe.instructions,
-            recipe_id
-        ))
-
-        # Delete old ingredients and tags
-        cursor.execute("DELETE FROM recipe_ingredients WHERE recipe_id = ?", (recipe_id,))
-        cursor.execute("DELETE FROM dietary_tags WHERE recipe_id = ?", (recipe_id,))
-
-        # Insert new ingredients
-        for ing in updated_recipe.ingredients:
-            ingredient_id = _get_or_create_ingredient(conn, ing.ingredient_name)
-
-            cursor.execute("""
-                INSERT INTO recipe_ingredients (recipe_id, ingredient_id, quantity, unit, preparation)
-                VALUES (?, ?, ?, ?, ?)
-            """, (recipe_id, ingredient_id, ing.quantity, ing.unit, ing.preparation))
-
-        # Insert new dietary tags
-        for tag in updated_recipe.dietary_tags:
-            cursor.execute("""
-                INSERT INTO dietary_tags (recipe_id, tag)
-                VALUES (?, ?)
-            """, (recipe_id, tag))
-
-        conn.commit()
-        return True
-
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
+    # Check if original recipe exists
+    cursor.execute("SELECT id FROM recipes WHERE LOWER(name) = LOWER(?)", (name,))
+    row = cursor.fetchone()
+    if not row:
+        return False
+
+    recipe_id = row[0]
+
+    # If name is changing, check for conflicts
+    if name.lower() != updated_recipe.name.lower():
+        cursor.execute("SELECT id FROM recipes WHERE LOWER(name) = LOWER(?)", (updated_recipe.name,))
+        if cursor.fetchone():
+            raise ValueError(f"Recipe '{updated_recipe.name}' already exists")
+
+    # Update recipe
+    cursor.execute("""
+        UPDATE recipes
+        SET name = ?, meal_type = ?, prep_time = ?, cook_time = ?,
+            servings = ?, cuisine = ?, instructions = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """, (
+        updated_recipe.name,
+        updated_recipe.meal_type,
+        updated_recipe.prep_time,
+        updated_recipe.cook_time,
+        updated_recipe.servings,
+        updated_recipe.cuisine,
+        updated_recipe.instructions,
+        recipe_id
+    ))
+
+    # Delete old ingredients and tags
+    cursor.execute("DELETE FROM recipe_ingredients WHERE recipe_id = ?", (recipe_id,))
+    cursor.execute("DELETE FROM dietary_tags WHERE recipe_id = ?", (recipe_id,))
+
+    # Insert new ingredients
+    ingredient_ids = _get_or_create_ingredients(
+        conn, [ing.ingredient_name for ing in updated_recipe.ingredients]
+    )
+    execute_many("""
+        INSERT INTO recipe_ingredients (recipe_id, ingredient_id, quantity, unit, preparation)
+        VALUES (?, ?, ?, ?, ?)
+    """, [
+        (recipe_id, ingredient_ids[normalize_ingredient_name(ing.ingredient_name)],
+         ing.quantity, ing.unit, ing.preparation)
+        for ing in updated_recipe.ingredients
+    ])
+
+    # Insert new dietary tags
+    execute_many("""
+        INSERT INTO dietary_tags (recipe_id, tag)
+        VALUES (?, ?)
+    """, [(recipe_id, tag) for tag in updated_recipe.dietary_tags])
+
+    return True
 
 
 def delete_recipe(name: str) -> bool:
@@ -341,9 +431,6 @@ def delete_recipe(name: str) -> bool:
     cursor.execute("DELETE FROM recipes WHERE LOWER(name) = LOWER(?)", (name,))
     deleted = cursor.rowcount > 0
 
-    conn.commit()
-    conn.close()
-
     return deleted
 
 
@@ -1,6 +1,7 @@
 """Utility functions for unit conversion and helpers."""
 
 import re
+from functools import lru_cache
 from typing import Tuple, Optional
 from fractions import Fraction
 
@@ -179,6 +180,20 @@ INGREDIENT_CATEGORIES = {
     "olives": "Canned Goods",
 }
 
+# Common fractions used when formatting quantities for display
+_COMMON_FRACTIONS = (
+    (0.125, "1/8"),
+    (0.25, "1/4"),
+    (0.333, "1/3"),
+    (0.5, "1/2"),
+    (0.667, "2/3"),
+    (0.75, "3/4"),
+)
+
+# Ingredient line patterns, compiled once: "quantity unit ingredient" and "quantity ingredient"
+_QTY_UNIT_NAME_RE = re.compile(r'^([\d\s./]+)\s+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s+(.+)$')
+_QTY_NAME_RE = re.compile(r'^([\d\s./]+)\s+(.+)$')
+
 
 def normalize_unit(unit: str) -> str:
     """
@@ -258,10 +273,14 @@ def can_convert_units(from_unit: str, to_unit: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=256)
 def parse_quantity(quantity_str: str) -> float:
     """
     Parse quantity string that may include fractions.
 
+    Cached, since recipes reuse a small set of quantity strings and the
+    Fraction parse for "1/2" or "1 1/2" is comparatively slow.
+
     Args:
         quantity_str: Quantity string (e.g., "1.5", "1/2", "1 1/2")
 
@@ -314,8 +333,7 @@ def parse_ingredient_string(text: str) -> Tuple[float, str, str]:
     text = text.strip()
 
     # Try to match "quantity unit ingredient"
-    pattern = r'^([\d\s./]+)\s+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s+(.+)$'
-    match = re.match(pattern, text)
+    match = _QTY_UNIT_NAME_RE.match(text)
 
     if match:
         quantity_str, unit, ingredient = match.groups()
@@ -326,8 +344,7 @@ def parse_ingredient_string(text: str) -> Tuple[float, str, str]:
             pass
 
     # Try to match "quantity ingredient" (no unit)
-    pattern = r'^([\d\s./]+)\s+(.+)$'
-    match = re.match(pattern, text)
+    match = _QTY_NAME_RE.match(text)
 
     if match:
         quantity_str, ingredient = match.groups()
@@ -341,10 +358,13 @@ def parse_ingredient_string(text: str) -> Tuple[float, str, str]:
     return 1.0, "whole", text.strip()
 
 
+@lru_cache(maxsize=4096)
 def get_ingredient_category(ingredient_name: str) -> str:
     """
     Determine store category for ingredient.
 
+    Results are cached; INGREDIENT_CATEGORIES is fixed at import.
+
     Args:
         ingredient_name: Name of the ingredient
 
@@ -355,10 +375,14 @@ def get_ingredient_category(ingredient_name: str) -> str:
     return INGREDIENT_CATEGORIES.get(ingredient_lower, "Other")
 
 
+@lru_cache(maxsize=256)
 def format_quantity(quantity: float) -> str:
     """
     Format quantity for display (e.g., 0.5 -> '1/2').
 
+    Cached, since the same handful of quantities (1/2, 1, 2, ...) recur
+    across recipes, grocery lists and exports.
+
     Args:
         quantity: Numeric quantity
 
@@ -369,18 +393,8 @@ def format_quantity(quantity: float) -> str:
     if quantity == int(quantity):
         return str(int(quantity))
 
-    # Common fractions
-    fractions = {
-        0.125: "1/8",
-        0.25: "1/4",
-        0.333: "1/3",
-        0.5: "1/2",
-        0.667: "2/3",
-        0.75: "3/4",
-    }
-
     # Check if quantity is close to a common fraction
-    for val, frac_str in fractions.items():
+    for val, frac_str in _COMMON_FRACTIONS:
         if abs(quantity - val) < 0.01:
             return frac_str
 
@@ -389,7 +403,7 @@ def format_quantity(quantity: float) -> str:
     remainder = quantity - whole
 
     if whole > 0:
-        for val, frac_str in fractions.items():
+        for val, frac_str in _COMMON_FRACTIONS:
             if abs(remainder - val) < 0.01:
                 return f"{whole} {frac_str}"
 
@@ -410,6 +424,15 @@ def normalize_ingredient_name(name: str) -> str:
     return name.lower().strip()
 
 
+# Common variants of a base ingredient name, treated as the same ingredient
+_INGREDIENT_VARIATIONS = {
+    "onion": frozenset({"onions", "yellow onion", "white onion"}),
+    "tomato": frozenset({"tomatoes"}),
+    "bell pepper": frozenset({"bell peppers", "red bell pepper", "green bell pepper"}),
+    "garlic": frozenset({"garlic cloves", "garlic clove"}),
+}
+
+
 def are_same_ingredient(name1: str, name2: str) -> bool:
     """
     Check if two ingredient names refer to the same ingredient.
@@ -429,14 +452,7 @@ def are_same_ingredient(name1: str, name2: str) -> bool:
         return True
 
     # Check for common variations
-    variations = {
-        "onion": ["onions", "yellow onion", "white onion"],
-        "tomato": ["tomatoes"],
-        "bell pepper": ["bell peppers", "red bell pepper", "green bell pepper"],
-        "garlic": ["garlic cloves", "garlic clove"],
-    }
-
-    for base, variants in variations.items():
+    for base, variants in _INGREDIENT_VARIATIONS.items():
         if normalized1 == base and normalized2 in variants:
             return True
         if normalized2 == base and normalized1 in variants: